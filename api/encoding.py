@@ -0,0 +1,148 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Encode fixed-shape query results straight to JSON bytes.
+
+FastAPI serializes a returned object by running it through jsonable_encoder
+and then json.dumps, which walks every dict of every row. The rows of the
+history and leaderboard endpoints always have the same shape, so they are
+written out here with one string template per row instead. Strings are
+escaped with the C encoder behind json.dumps, and the output is identical to
+FastAPI's JSONResponse (compact separators, non-ASCII left unescaped).
+"""
+
+from json.encoder import encode_basestring
+from typing import Iterable
+
+from fastapi.responses import Response
+
+
+class RawJSONResponse(Response):
+    """A response whose content is already encoded JSON bytes."""
+
+    media_type = "application/json"
+
+
+def encode_value(value: str | int | None) -> str:
+    """Encode a string, integer, or None as a JSON value.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        The JSON representation of value.
+    """
+
+    if value is None:
+        return "null"
+
+    if isinstance(value, str):
+        return encode_basestring(value)
+
+    return str(value)
+
+
+def encode_history_objects(
+        rows: Iterable[tuple[str | None, str | None]], separator: str = ","
+) -> str:
+    """Encode history rows as JSON objects joined by a separator.
+
+    Both columns are nullable, so None is encoded as null.
+
+    Args:
+        rows: Rows in the form (date, speaker_username).
+        separator: The string placed between objects.
+
+    Returns:
+        The {"date": str | None, "username": str | None} objects of the rows.
+    """
+
+    return separator.join(
+        f'{{"date":{encode_value(date)},'
+        f'"username":{encode_value(username)}}}'
+        for date, username in rows
+    )
+
+
+def encode_history(rows: Iterable[tuple[str, str]]) -> str:
+    """Encode history rows as a JSON array.
+
+    Args:
+        rows: Rows in the form (date, speaker_username).
+
+    Returns:
+        A JSON array of {"date": str, "username": str} objects.
+    """
+
+    return "[" + encode_history_objects(rows) + "]"
+
+
+def encode_history_page(
+        rows: Iterable[tuple[str, str]], next_cursor: str | None
+) -> str:
+    """Encode a page of history rows with its cursor.
+
+    Args:
+        rows: Rows in the form (date, speaker_username).
+        next_cursor: The cursor of the next page, if any.
+
+    Returns:
+        A JSON object in the form {"history": [...], "next_cursor": str|null}.
+    """
+
+    return (
+        f'{{"history":{encode_history(rows)},'
+        f'"next_cursor":{encode_value(next_cursor)}}}'
+    )
+
+
+def encode_leaderboard(rows: Iterable[tuple[str, int]]) -> str:
+    """Encode leaderboard rows as a JSON array.
+
+    Args:
+        rows: Rows in the form (speaker_username, count).
+
+    Returns:
+        A JSON array of {"username": str, "count": int} objects.
+    """
+
+    return "[" + ",".join(
+        f'{{"username":{encode_basestring(username)},"count":{count:d}}}'
+        for username, count in rows
+    ) + "]"
+
+
+def encode_series(buckets: Iterable[str], counts: Iterable[int]) -> str:
+    """Encode a time series as parallel JSON arrays.
+
+    Args:
+        buckets: The start of every bucket.
+        counts: The count of every bucket.
+
+    Returns:
+        A JSON object in the form {"buckets": [str], "counts": [int]}.
+    """
+
+    return (
+        '{"buckets":[' + ",".join(map(encode_basestring, buckets)) + "],"
+        '"counts":[' + ",".join(map(str, counts)) + "]}"
+    )
@@ -0,0 +1,326 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Push live meter, leaderboard, and history updates to dashboard clients.
+
+A single ChangeWatcher polls the data version (one primary key read) and only
+queries the meter, leaderboard, and new history entries when it changes. The
+resulting Server-Sent Events are fanned out to every subscribed client through
+a bounded queue per client, so the database cost does not grow with the number
+of open dashboards.
+
+Events:
+    meter: {"meter": int}
+    leaderboard:
+        {"changes": [{"username": str, "count": int}, ...]} with only the
+        speakers whose count changed (count 0 means the speaker was removed).
+        A new subscriber first receives the whole leaderboard.
+    history:
+        {"history": [{"date": str, "username": str}, ...]} with the entries
+        recorded since the previous event, newest first.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from typing import Tuple
+
+from sqlalchemy import Row
+
+from config import EVENTS_POLL_INTERVAL, EVENTS_QUEUE_SIZE
+
+from db.crud import (
+    get_data_version, get_history_since, get_leaderboard, get_meter
+)
+from db.database import get_session
+
+
+# Maximum number of new history entries sent in one history event.
+HISTORY_EVENT_LIMIT: int = 20
+
+
+def format_event(event: str, data: dict) -> str:
+    """Serialize an event in the Server-Sent Events wire format.
+
+    Args:
+        event: The event name.
+        data: The JSON-serializable event payload.
+
+    Returns:
+        The event as an SSE message string.
+    """
+
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class ChangeWatcher:
+    """Watch the database for changes and fan events out to subscribers.
+
+    Attributes:
+        poll_interval: Seconds between data version checks.
+        queue_size: Number of undelivered events a subscriber may have before
+            it is dropped as too slow.
+        logger: Logger object that logs events from this watcher.
+    """
+
+    def __init__(
+            self,
+            poll_interval: float = EVENTS_POLL_INTERVAL,
+            queue_size: int = EVENTS_QUEUE_SIZE
+    ):
+        """Initialize a watcher with no subscribers.
+
+        Args:
+            poll_interval: Seconds between data version checks.
+            queue_size: Number of undelivered events allowed per subscriber.
+        """
+
+        self.poll_interval: float = poll_interval
+        self.queue_size: int = queue_size
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+        self._subscribers: set[asyncio.Queue[str]] = set()
+        self._task: asyncio.Task | None = None
+        self._version: int | None = None
+        self._meter: int = 0
+        self._leaderboard: dict[str, int] = {}
+        self._cursor: Tuple[int, frozenset[str]] | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue[str]:
+        """Register a client and queue a snapshot of the current state.
+
+        Returns:
+            The queue the client's events are delivered to.
+        """
+
+        queue: asyncio.Queue[str] = asyncio.Queue(self.queue_size)
+        queue.put_nowait(format_event("meter", {"meter": self._meter}))
+        queue.put_nowait(format_event("leaderboard", {"changes": [
+            {"username": username, "count": count}
+            for username, count in self._leaderboard.items()
+        ]}))
+
+        self._subscribers.add(queue)
+
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[str]) -> None:
+        """Remove a client.
+
+        Args:
+            queue: The queue returned by subscribe.
+
+        Returns:
+            None
+        """
+
+        self._subscribers.discard(queue)
+
+    def is_subscribed(self, queue: asyncio.Queue[str]) -> bool:
+        """Check if a client is still subscribed.
+
+        Clients are unsubscribed by the watcher when their queue overflows.
+
+        Args:
+            queue: The queue returned by subscribe.
+
+        Returns:
+            True if the client is still subscribed.
+        """
+
+        return queue in self._subscribers
+
+    async def start(self) -> None:
+        """Read the current state, then start polling in a background task.
+
+        Reading first means clients that subscribe during startup receive the
+        actual meter and leaderboard in their snapshot.
+
+        Returns:
+            None
+        """
+
+        await self._poll_once()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling and unsubscribe every client.
+
+        Each client is woken with an empty message so its stream ends instead
+        of waiting for the next event.
+
+        Returns:
+            None
+        """
+
+        if self._task is not None:
+            self._task.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+            self._task = None
+
+        for queue in self._subscribers:
+            with contextlib.suppress(asyncio.QueueFull):
+                queue.put_nowait("")
+
+        self._subscribers.clear()
+
+    async def _run(self) -> None:
+        """Poll for changes forever and publish the resulting events.
+
+        Returns:
+            None
+        """
+
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            await self._poll_once()
+
+    async def _poll_once(self) -> None:
+        """Poll for changes once and publish the resulting events.
+
+        Errors are logged, so the next poll tries again.
+
+        Returns:
+            None
+        """
+
+        try:
+            changes: tuple | None = await asyncio.to_thread(self._poll)
+
+            if changes is not None:
+                self._apply(*changes)
+        except Exception as e:
+            self.logger.exception("Error polling for changes: %s", e)
+
+    def _poll(self) -> tuple | None:
+        """Read the current state if the data version changed.
+
+        Runs in a worker thread and does not touch the watcher's state.
+
+        Returns:
+            A tuple in the form (version, meter, leaderboard, history) if the
+            version changed; otherwise None. history holds the rows not seen
+            by the watcher's cursor, newest first.
+        """
+
+        with get_session() as session:
+            version: int = get_data_version(session)
+
+            if version == self._version:
+                return None
+
+            meter: int = get_meter(session)
+            leaderboard: dict[str, int] = dict(get_leaderboard(session).all())
+            history: list[Row] = get_history_since(
+                session, self._cursor, HISTORY_EVENT_LIMIT
+            )
+
+        return version, meter, leaderboard, history
+
+    def _apply(
+            self,
+            version: int,
+            meter: int,
+            leaderboard: dict[str, int],
+            history: list[Row]
+    ) -> None:
+        """Update the watcher's state and publish what changed.
+
+        The first poll initializes the state and sends it as a snapshot to
+        the clients that subscribed before it, without history.
+
+        Args:
+            version: The new data version.
+            meter: The new meter value.
+            leaderboard: The new leaderboard as {username: count}.
+            history: The new history rows, newest first.
+
+        Returns:
+            None
+        """
+
+        initialized: bool = self._version is not None
+
+        if not initialized:
+            self._publish(format_event("meter", {"meter": meter}))
+            self._publish(format_event("leaderboard", {"changes": [
+                {"username": username, "count": count}
+                for username, count in leaderboard.items()
+            ]}))
+        elif meter != self._meter:
+            self._publish(format_event("meter", {"meter": meter}))
+
+        changes: list[dict] = [
+            {"username": username, "count": leaderboard.get(username, 0)}
+            for username in self._leaderboard.keys() | leaderboard.keys()
+            if self._leaderboard.get(username) != leaderboard.get(username)
+        ]
+
+        if initialized and changes:
+            self._publish(format_event("leaderboard", {"changes": changes}))
+
+        if initialized and history:
+            self._publish(format_event("history", {"history": [
+                {"date": date, "username": username}
+                for _, _, date, username in history
+            ]}))
+
+        if history:
+            newest: int = history[0].ts
+            seen: set[str] = {row.id for row in history if row.ts == newest}
+
+            if self._cursor is not None and self._cursor[0] == newest:
+                seen |= self._cursor[1]
+
+            self._cursor = (newest, frozenset(seen))
+
+        self._version = version
+        self._meter = meter
+        self._leaderboard = leaderboard
+
+    def _publish(self, event: str) -> None:
+        """Deliver an event to every subscriber.
+
+        Subscribers whose queue is full are dropped; their EventSource will
+        reconnect and receive a fresh snapshot.
+
+        Args:
+            event: The SSE message string.
+
+        Returns:
+            None
+        """
+
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._subscribers.discard(queue)
+                self.logger.warning("Dropped a slow event subscriber")
@@ -0,0 +1,389 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Store downloaded pictures on disk, content-addressed, with LRU eviction.
+
+Each picture is saved as <sha256 of its bytes>.<extension> under
+IMAGE_CACHE_DIR. A file's content never changes, so it can be served with
+immutable cache headers, by the API or straight from disk by nginx. The
+source URL of each file is kept in index.json next to the files, so a restart
+does not download the pictures again.
+
+Once the files take up more than max_bytes, the least recently used ones are
+deleted. A picture counts as used when it is downloaded or looked up. The
+modification time of the file records this, at most once per TOUCH_INTERVAL,
+so the order survives restarts. Files are written on a worker thread.
+"""
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import threading
+import time
+
+import httpx
+
+from config import IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_BYTES
+
+
+# Extensions of the image content types that are cached.
+EXTENSIONS: dict[str, str] = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+}
+
+NAME_PATTERN: re.Pattern = re.compile(r"[0-9a-f]{64}\.(?:jpg|png|webp)")
+
+INDEX_NAME: str = "index.json"
+
+# Seconds before a used picture's modification time is updated again. Within
+# the interval, the order of use is only kept in memory.
+TOUCH_INTERVAL: float = 60.0
+
+
+class ImageCache:
+    """Download pictures once and keep them on disk within a size budget.
+
+    Attributes:
+        directory: Folder the pictures are stored in.
+        max_bytes: Total size of the stored pictures before eviction.
+        logger: Logger object that logs events from this cache.
+        size: Total size of the stored pictures in bytes.
+        evictions: Number of pictures deleted to stay within max_bytes.
+    """
+
+    def __init__(
+            self,
+            directory: Path = IMAGE_CACHE_DIR,
+            max_bytes: int = IMAGE_CACHE_MAX_BYTES
+    ):
+        """Initialize the cache with the pictures already on disk.
+
+        Args:
+            directory: Folder the pictures are stored in.
+            max_bytes: Total size of the stored pictures before eviction.
+        """
+
+        self.directory: Path = directory
+        self.max_bytes: int = max_bytes
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+        self.size: int = 0
+        self.evictions: int = 0
+
+        # name -> size in bytes, least recently used first.
+        self._files: OrderedDict[str, int] = OrderedDict()
+        # name -> modification time of the file
+        self._mtimes: dict[str, float] = {}
+        # source url -> name
+        self._names: dict[str, str] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._index_lock: threading.Lock = threading.Lock()
+
+        self._load()
+
+    def path(self, name: str) -> Path | None:
+        """Find the file of a cached picture and mark it as used.
+
+        Args:
+            name: The file name of the picture.
+
+        Returns:
+            The path of the file, or None if the name is not cached.
+        """
+
+        if not NAME_PATTERN.fullmatch(name):
+            return None
+
+        with self._lock:
+            if name not in self._files:
+                return None
+
+            self._touch(name)
+
+        return self.directory / name
+
+    def lookup(self, url: str) -> str | None:
+        """Find the cached copy of a picture and mark it as used.
+
+        Args:
+            url: The source URL of the picture.
+
+        Returns:
+            The file name of the picture, or None if it is not cached.
+        """
+
+        with self._lock:
+            name: str | None = self._names.get(url)
+
+            if name is None or name not in self._files:
+                return None
+
+            self._touch(name)
+
+        return name
+
+    def stats(self) -> dict:
+        """Report the state of the cache.
+
+        Returns:
+            A dictionary containing:
+                files (int): Number of stored pictures.
+                bytes (int): Total size of the stored pictures.
+                evictions (int): Pictures deleted to stay within max_bytes.
+        """
+
+        with self._lock:
+            return {
+                "files": len(self._files),
+                "bytes": self.size,
+                "evictions": self.evictions
+            }
+
+    async def fetch(self, client: httpx.AsyncClient, url: str) -> str:
+        """Download a picture unless it is already cached.
+
+        Args:
+            client: The HTTP client used for the download.
+            url: The source URL of the picture.
+
+        Returns:
+            The file name of the picture.
+
+        Raises:
+            httpx.HTTPError: If the download fails or times out.
+            ValueError: If the response is not a supported image or does not
+                fit in the cache.
+        """
+
+        name: str | None = self.lookup(url)
+
+        if name is not None:
+            return name
+
+        chunks: list[bytes] = []
+        received: int = 0
+
+        # Streamed, so an oversized picture is abandoned before it is read.
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+
+            content_type: str = response.headers.get("content-type", "")
+            extension: str | None = EXTENSIONS.get(
+                content_type.split(";")[0].strip().lower()
+            )
+
+            if extension is None:
+                raise ValueError(f"Unsupported content type {content_type!r}")
+
+            if int(response.headers.get("content-length", 0)) > self.max_bytes:
+                raise ValueError("Picture is larger than the cache")
+
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+
+                if received > self.max_bytes:
+                    raise ValueError("Picture is larger than the cache")
+
+                chunks.append(chunk)
+
+        content: bytes = b"".join(chunks)
+        digest: str = hashlib.sha256(content).hexdigest()
+        name = f"{digest}.{extension}"
+
+        await asyncio.to_thread(self._store, url, name, content)
+
+        return name
+
+    async def fetch_all(
+            self, client: httpx.AsyncClient, urls: list[str]
+    ) -> int:
+        """Download every picture that is not cached yet.
+
+        A failed download is logged and skipped.
+
+        Args:
+            client: The HTTP client used for the downloads.
+            urls: The source URLs of the pictures.
+
+        Returns:
+            The int number of pictures available in the cache.
+        """
+
+        cached: int = 0
+
+        for url in urls:
+            try:
+                await self.fetch(client, url)
+                cached += 1
+            except Exception as e:
+                self.logger.warning("Failed to cache %s: %r", url, e)
+
+        return cached
+
+    def _load(self) -> None:
+        """Read the pictures and index already on disk.
+
+        Returns:
+            None
+        """
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        files: list[tuple[float, str, int]] = []
+
+        for path in self.directory.iterdir():
+            if NAME_PATTERN.fullmatch(path.name):
+                stat: os.stat_result = path.stat()
+                files.append((stat.st_mtime, path.name, stat.st_size))
+
+        for mtime, name, file_size in sorted(files):
+            self._files[name] = file_size
+            self._mtimes[name] = mtime
+            self.size += file_size
+
+        try:
+            index: dict[str, str] = json.loads(
+                (self.directory / INDEX_NAME).read_text()
+            )
+        except (OSError, ValueError):
+            index = {}
+
+        self._names = {
+            url: name for url, name in index.items() if name in self._files
+        }
+
+    def _store(self, url: str, name: str, content: bytes) -> None:
+        """Write a picture to disk and evict pictures over the budget.
+
+        Runs in a worker thread. The lock is only held while the in-memory
+        state is updated, so lookups never wait on disk writes.
+
+        Args:
+            url: The source URL of the picture.
+            name: The file name of the picture.
+            content: The bytes of the picture.
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            stored: bool = name in self._files
+
+        if not stored:
+            self._write(name, content)
+
+        with self._lock:
+            if name not in self._files:
+                self._files[name] = len(content)
+                self._mtimes[name] = time.time()
+                self.size += len(content)
+
+            self._names[url] = name
+            self._touch(name)
+            evicted: list[str] = self._evict()
+
+        for evicted_name in evicted:
+            (self.directory / evicted_name).unlink(missing_ok=True)
+
+        # Serializes index writes so an older index never replaces a newer one.
+        with self._index_lock:
+            with self._lock:
+                index: bytes = json.dumps(self._names).encode()
+
+            self._write(INDEX_NAME, index)
+
+    def _touch(self, name: str) -> None:
+        """Mark a picture as the most recently used.
+
+        The modification time of the file is only updated if it is older
+        than TOUCH_INTERVAL.
+
+        Args:
+            name: The file name of the picture.
+
+        Returns:
+            None
+        """
+
+        self._files.move_to_end(name)
+
+        now: float = time.time()
+
+        if now - self._mtimes.get(name, 0.0) < TOUCH_INTERVAL:
+            return
+
+        self._mtimes[name] = now
+
+        try:
+            os.utime(self.directory / name, (now, now))
+        except OSError:
+            pass
+
+    def _evict(self) -> list[str]:
+        """Forget the least recently used pictures until within max_bytes.
+
+        Returns:
+            The file names of the forgotten pictures, to be deleted from disk.
+        """
+
+        evicted: list[str] = []
+
+        while self.size > self.max_bytes and len(self._files) > 1:
+            name, file_size = self._files.popitem(last=False)
+            self._mtimes.pop(name, None)
+            self.size -= file_size
+            self.evictions += 1
+            evicted.append(name)
+
+        if evicted:
+            forgotten: set[str] = set(evicted)
+            self._names = {
+                url: name for url, name in self._names.items()
+                if name not in forgotten
+            }
+
+        return evicted
+
+    def _write(self, name: str, content: bytes) -> None:
+        """Write a file atomically so readers never see a partial file.
+
+        Args:
+            name: The file name.
+            content: The bytes of the file.
+
+        Returns:
+            None
+        """
+
+        temporary: Path = (
+            self.directory / f".{name}.{threading.get_ident()}.tmp"
+        )
+        temporary.write_bytes(content)
+        os.replace(temporary, self.directory / name)
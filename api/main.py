@@ -28,37 +28,99 @@ the database including meter readings, user history, and leaderboard statistics.
 Static frontend assets are served with cache-busting support to ensure the
 latest versions are loaded.
 
+Endpoints are asynchronous and read the database through an asyncio session
+(see get_db_session), so concurrent requests are bounded by the event loop
+rather than the threadpool.
+
 Examples:
-    To run the app using Uvicorn in production:
+    To run the app in production (see the API_* settings in config.py):
 
-        uvicorn api.main:app --host 0.0.0.0 --port 8080
+        python -m api.main
 
     To run the app in development mode:
 
         uvicorn api.main:app --reload
 """
 
-import random
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Annotated, AsyncIterator, Iterator, Literal, Tuple
+import zlib
 
-from fastapi import FastAPI
+from anyio import to_thread
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
-import requests
+import uvicorn
 
-from sqlalchemy import Result
+from sqlalchemy import Result, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-from config import PEXELS_API_KEY, PEXELS_URL
+from config import (
+    API_GZIP_LEVEL, API_GZIP_MINIMUM_SIZE, API_HOST, API_PORT,
+    API_SHUTDOWN_TIMEOUT, API_THREADPOOL_SIZE, API_WORKERS,
+    EVENTS_KEEPALIVE_INTERVAL
+)
 
+from api.encoding import (
+    RawJSONResponse, encode_history_objects, encode_history_page,
+    encode_leaderboard, encode_series
+)
+from api.events import ChangeWatcher
+from api.images import ImageCache
+from api.photos import PhotoPool
+from api.singleflight import SingleFlight
+
+from db import async_crud
+from db.cache import VersionedCache
 from db.crud import (
     get_achievements as crud_get_achievements,
+    get_achievements_key as crud_get_achievements_key,
     get_history as crud_get_history,
+    get_history_page as crud_get_history_page,
     get_leaderboard as crud_get_leaderboard,
     get_meter as crud_get_meter
 )
-from db.database import get_session
+from db.database import begin_read, get_async_session, get_session
+from db.models import to_epoch_ms
+
+
+change_watcher: ChangeWatcher = ChangeWatcher()
+image_cache: ImageCache = ImageCache()
+photo_pool: PhotoPool = PhotoPool(image_cache=image_cache)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the background change watcher and photo pool for the lifetime of
+    the app.
+
+    Also sizes the threadpool that runs blocking work such as the history
+    export to API_THREADPOOL_SIZE threads.
 
+    Args:
+        app: The FastAPI application.
 
-app = FastAPI()
+    Yields:
+        None
+    """
+
+    to_thread.current_default_thread_limiter().total_tokens = (
+        API_THREADPOOL_SIZE
+    )
+    await change_watcher.start()
+    photo_pool.start()
+    yield
+    await photo_pool.stop()
+    await change_watcher.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_headers=["*"],
@@ -69,65 +131,445 @@ app.add_middleware(
         "https://masameter.xyz"
     ],
 )
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=API_GZIP_MINIMUM_SIZE,
+    compresslevel=API_GZIP_LEVEL
+)
+
+EXPORT_CHUNK_SIZE: int = 1000
+
+achievements_cache: VersionedCache[list[str]] = VersionedCache(
+    crud_get_achievements, key=crud_get_achievements_key
+)
+single_flight: SingleFlight = SingleFlight()
+
+
+async def get_db_session() -> AsyncIterator[AsyncSession]:
+    """Provide an asyncio database session to an endpoint.
+
+    Used as a FastAPI dependency; the session is closed once the endpoint
+    returns.
+
+    Yields:
+        A SQLAlchemy asyncio session bound to the asyncio engine.
+    """
+
+    async with get_async_session() as session:
+        yield session
+
+
+DbSession = Annotated[AsyncSession, Depends(get_db_session)]
+
+
+async def _cache_headers(
+        session: AsyncSession, variant: int | None = None
+) -> dict[str, str]:
+    """Build the caching headers of a data endpoint.
+
+    Every data endpoint is derived from the masa_mentions table, so the data
+    version doubles as the ETag. Responses may be stored but must be
+    revalidated on every use, so browsers and nginx never serve data older
+    than the live events.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+        variant: What the response depends on besides the data (for
+            achievements, see db.crud.get_achievements_key), or None.
+
+    Returns:
+        A dictionary containing the ETag and Cache-Control headers.
+    """
+
+    version: int = await async_crud.get_data_version(session)
+    tag: str = f"{version}" if variant is None else f"{version}-{variant}"
+
+    return {
+        "ETag": f'W/"{tag}"',
+        "Cache-Control": "no-cache"
+    }
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check the If-None-Match header of a request against an ETag.
+
+    Uses the weak comparison required for If-None-Match.
+
+    Args:
+        request: The incoming HTTP request.
+        etag: The current ETag of the resource.
+
+    Returns:
+        True if the client already holds the current representation.
+    """
+
+    client_etags: set[str] = {
+        tag.strip().removeprefix("W/")
+        for tag in request.headers.get("if-none-match", "").split(",")
+    }
+
+    return "*" in client_etags or etag.removeprefix("W/") in client_etags
+
+
+async def _conditional_get(
+        request: Request,
+        response: Response,
+        session: AsyncSession,
+        variant: int | None = None
+) -> Response | None:
+    """Apply version-based HTTP caching to a data endpoint.
+
+    Sets the caching headers on the response and, if the client already holds
+    the current version, builds a 304 response so the endpoint can skip its
+    queries.
+
+    Args:
+        request: The incoming HTTP request.
+        response: The response the endpoint will return.
+        session: A SQLAlchemy asyncio session with the database.
+        variant: What the response depends on besides the data, or None.
+
+    Returns:
+        A 304 Not Modified response if the If-None-Match header matches the
+        current version; otherwise None.
+    """
+
+    headers: dict[str, str] = await _cache_headers(session, variant)
+
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+
+    return None
 
 
 @app.get("/api/meter")
-def get_meter() -> list[dict]:
+async def get_meter(
+        request: Request, response: Response, session: DbSession
+) -> list[dict]:
     """Retrieve meter data from the database.
 
+    Args:
+        request: The incoming HTTP request.
+        response: The outgoing HTTP response.
+        session: A SQLAlchemy asyncio session with the database.
+
     Returns:
         A list with one element containing the meter data wrapped in a
         dictionary.
     """
 
-    with get_session() as session:
-        result: int = crud_get_meter(session)
+    if not_modified := await _conditional_get(request, response, session):
+        return not_modified
+
+    result: int = await async_crud.get_meter(session)
 
     return [{"meter": result}]
 
 
-@app.get("/api/history")
-def get_history() -> list[dict]:
-    """Retrieve history record of the MasaMention table from database.
+def _encode_cursor(ts: int, mention_id: str) -> str:
+    """Encode the position of a history entry as a page cursor.
+
+    Args:
+        ts: The epoch milliseconds of the entry.
+        mention_id: The id of the entry.
 
     Returns:
-        A list of dictionaries with each entry containing:
-            id (int):
-                Unique primary key of the MasaMention entry.
-            date (str):
-                ISO formatted string representation of the date in UTC.
-            username (str):
-                Discord username of the Speaker attached to the entry.
+        The cursor string in the form "ts:id".
     """
 
-    with get_session() as session:
-        results: Result = crud_get_history(session)
+    return f"{ts}:{mention_id}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[int, str]:
+    """Decode a page cursor produced by _encode_cursor.
+
+    Args:
+        cursor: The cursor string in the form "ts:id".
+
+    Returns:
+        A tuple in the form (ts, id).
+
+    Raises:
+        HTTPException: The cursor is malformed (400).
+    """
+
+    ts, _, mention_id = cursor.partition(":")
+
+    if not ts.isdigit() or not mention_id:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return int(ts), mention_id
+
+
+def _next_cursor(rows: list[Row], limit: int) -> str | None:
+    """Find the cursor of the page after a history page.
+
+    Args:
+        rows: Up to limit + 1 rows from crud.get_history_page. The extra row
+            only signals that another page exists.
+        limit: The page size.
+
+    Returns:
+        The cursor of the next page, or None if this is the last page.
+    """
+
+    if len(rows) <= limit:
+        return None
+
+    ts, mention_id, _, _ = rows[limit - 1]
+
+    return _encode_cursor(ts, mention_id)
+
+
+def _format_history_page(rows: list[Row], limit: int) -> dict:
+    """Format the rows of a history page query as a response body.
+
+    Args:
+        rows: Up to limit + 1 rows from crud.get_history_page. The extra row
+            only signals that another page exists.
+        limit: The page size.
+
+    Returns:
+        A dictionary containing history and next_cursor (see get_history).
+    """
 
     history: list[dict] = []
 
-    for date, username in results:
+    for _, _, date, username in rows[:limit]:
         history.append({
             "date": date,
             "username": username
         })
 
-    return history
+    return {"history": history, "next_cursor": _next_cursor(rows, limit)}
 
 
-@app.get("/api/leaderboard")
-def get_leaderboard() -> list[dict]:
-    """Retrieve the Speaker's with the most MasaMention entries.
+@app.get("/api/history")
+async def get_history(
+        request: Request,
+        session: DbSession,
+        limit: int = Query(50, ge=1, le=500),
+        cursor: str | None = None,
+        before: datetime | None = None,
+        after: datetime | None = None,
+        speaker: str | None = None
+) -> Response:
+    """Retrieve one page of the MasaMention history, newest first.
+
+    Pages are keyset-paginated: pass the next_cursor of a response as the
+    cursor of the next request to continue where it left off. The rows are
+    encoded directly by api.encoding.
+
+    Args:
+        request: The incoming HTTP request.
+        session: A SQLAlchemy asyncio session with the database.
+        limit: The maximum number of entries in the page.
+        cursor: The next_cursor returned with the previous page.
+        before: Only return entries dated before this ISO-8601 datetime.
+        after: Only return entries dated at or after this ISO-8601 datetime.
+        speaker: Only return entries attached to this Discord username.
+
+    Returns:
+        A dictionary containing:
+            history (list[dict]):
+                The entries of the page, each containing:
+                    date (str):
+                        ISO formatted string representation of the date in UTC.
+                    username (str):
+                        Discord username of the Speaker attached to the entry.
+            next_cursor (str | None):
+                Cursor of the next page, or None if this is the last page.
+    """
 
-    Leaderboard is ordered from most to fewest entries.
+    headers: dict[str, str] = await _cache_headers(session)
+
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    rows: list[Row] = await async_crud.get_history_page(
+        session,
+        limit + 1,
+        cursor=_decode_cursor(cursor) if cursor else None,
+        before=to_epoch_ms(before) if before else None,
+        after=to_epoch_ms(after) if after else None,
+        speaker=speaker
+    )
+
+    body: str = encode_history_page(
+        ((date, username) for _, _, date, username in rows[:limit]),
+        _next_cursor(rows, limit)
+    )
+
+    return RawJSONResponse(body, headers=headers)
+
+
+@app.get("/api/history/series")
+async def get_history_series(
+        request: Request,
+        session: DbSession,
+        bucket: Literal["hour", "day", "week", "month"] = "day",
+        speaker: str | None = None,
+        start: datetime | None = Query(None, alias="from"),
+        end: datetime | None = Query(None, alias="to")
+) -> Response:
+    """Count MasaMention entries per time bucket.
+
+    The counts are aggregated in SQL, from the daily rollups whenever the
+    bounds allow it (see crud.get_series), so the response size depends on
+    the number of buckets rather than mentions.
+
+    Args:
+        request: The incoming HTTP request.
+        session: A SQLAlchemy asyncio session with the database.
+        bucket: The UTC bucket size. Weeks start on Monday.
+        speaker: Only count entries attached to this Discord username.
+        start: Only count entries dated at or after this ISO-8601 datetime.
+        end: Only count entries dated before this ISO-8601 datetime.
 
     Returns:
-        A list of dictionaries with each entry containing:
-            username (str): Discord usernmae of the Speaker.
-            count (int): Number of MasaMention entries attached to the Speaker.
+        A dictionary containing two parallel lists:
+            buckets (list[str]):
+                ISO formatted start of every bucket in UTC, oldest first.
+                Buckets without entries are omitted.
+            counts (list[int]):
+                Number of entries in every bucket.
     """
 
+    headers: dict[str, str] = await _cache_headers(session)
+
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    rows: list[Row] = await async_crud.get_series(
+        session,
+        bucket,
+        start=to_epoch_ms(start) if start else None,
+        end=to_epoch_ms(end) if end else None,
+        speaker=speaker
+    )
+    body: str = encode_series(
+        (
+            datetime.fromtimestamp(bucket_start / 1000, timezone.utc)
+            .isoformat()
+            for bucket_start, _ in rows
+        ),
+        (count for _, count in rows)
+    )
+
+    return RawJSONResponse(body, headers=headers)
+
+
+def _export_history(fmt: str) -> Iterator[bytes]:
+    """Yield the whole MasaMention history in chunks of encoded rows.
+
+    Rows are fetched from a server-side cursor EXPORT_CHUNK_SIZE at a time, so
+    memory use stays flat no matter how large the table is.
+
+    Args:
+        fmt: "ndjson" for one JSON object per line, "json" for a JSON array.
+
+    Yields:
+        UTF-8 encoded chunks of the export.
+    """
+
+    separator: str = "\n" if fmt == "ndjson" else ","
+    first: bool = True
+
+    if fmt == "json":
+        yield b"["
+
     with get_session() as session:
-        results: Result = crud_get_leaderboard(session)
+        results: Result = crud_get_history(session, yield_per=EXPORT_CHUNK_SIZE)
+
+        for partition in results.partitions():
+            chunk: str = encode_history_objects(partition, separator)
+
+            if fmt == "ndjson":
+                yield (chunk + separator).encode()
+            else:
+                yield ((separator if not first else "") + chunk).encode()
+
+            first = False
+
+    if fmt == "json":
+        yield b"]"
+
+
+def _gzip_stream(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Compress a stream of chunks into a single gzip stream.
+
+    Args:
+        chunks: The uncompressed chunks.
+
+    Yields:
+        The gzip-compressed chunks.
+    """
+
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    for chunk in chunks:
+        compressed: bytes = compressor.compress(chunk)
+
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
+
+
+@app.get("/api/history/export")
+async def export_history(
+        request: Request,
+        session: DbSession,
+        format: Literal["ndjson", "json"] = "ndjson"
+) -> Response:
+    """Stream the whole MasaMention history.
+
+    The response is gzip-compressed when the client accepts it. The rows are
+    read and encoded in the threadpool.
+
+    Args:
+        request: The incoming HTTP request.
+        session: A SQLAlchemy asyncio session with the database.
+        format: "ndjson" (default) for newline-delimited JSON objects, or
+            "json" for a single JSON array.
+
+    Returns:
+        A streaming response of objects, oldest first, each containing:
+            date (str):
+                ISO formatted string representation of the date in UTC.
+            username (str):
+                Discord username of the Speaker attached to the entry.
+    """
+
+    headers: dict[str, str] = await _cache_headers(session)
+
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    media_type: str = (
+        "application/x-ndjson" if format == "ndjson" else "application/json"
+    )
+    headers["Vary"] = "Accept-Encoding"
+    body: Iterator[bytes] = _export_history(format)
+
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        body = _gzip_stream(body)
+
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+def _format_leaderboard(results: list[Row]) -> list[dict]:
+    """Format leaderboard rows as a response body.
+
+    Args:
+        results: The rows from crud.get_leaderboard.
+
+    Returns:
+        A list of dictionaries (see get_leaderboard).
+    """
 
     leaderboard: list[dict] = []
 
@@ -139,16 +581,77 @@ def get_leaderboard() -> list[dict]:
 
     return leaderboard
 
-@app.get("/api/achievements")
-def get_achievements() -> list[dict]:
+
+async def _read_cache_headers(variant: int | None = None) -> dict[str, str]:
+    """Build the caching headers of a data endpoint in a session of its own.
+
+    The session is closed before the endpoint waits on a shared read, so
+    waiting requests do not hold pool connections.
+
+    Args:
+        variant: What the response depends on besides the data, or None.
+
+    Returns:
+        A dictionary containing the ETag and Cache-Control headers.
     """
+
+    async with get_async_session() as session:
+        return await _cache_headers(session, variant)
+
+
+async def _read_leaderboard() -> str:
+    """Read and encode the whole leaderboard in a session of its own.
+
+    Returns:
+        The leaderboard as a JSON array.
+    """
+
+    async with get_async_session() as session:
+        results: list[Row] = await async_crud.get_leaderboard(session)
+
+    return encode_leaderboard(results)
+
+
+@app.get("/api/leaderboard")
+async def get_leaderboard(request: Request) -> Response:
+    """Retrieve the Speaker's with the most MasaMention entries.
+
+    Leaderboard is ordered from most to fewest entries. The rows are encoded
+    directly by api.encoding. A client holding the current version gets a 304
+    without the leaderboard being read; concurrent requests for the same
+    version share one read.
+
+    Args:
+        request: The incoming HTTP request.
+
+    Returns:
+        A list of dictionaries with each entry containing:
+            username (str): Discord usernmae of the Speaker.
+            count (int): Number of MasaMention entries attached to the Speaker.
+    """
+
+    headers: dict[str, str] = await _read_cache_headers()
+
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    body: str = await single_flight.do(
+        ("leaderboard", headers["ETag"]), _read_leaderboard
+    )
+
+    return RawJSONResponse(body, headers=headers)
+
+
+def _format_achievements(achievements_list: list[str]) -> list[dict]:
+    """Format the achievement holders as a response body.
+
+    Args:
+        achievements_list: The usernames from crud.get_achievements.
+
+    Returns:
+        A list of dictionaries (see get_achievements).
     """
 
-    with get_session() as session:
-        achievements_list: list[str] = (
-            crud_get_achievements(session)
-        )
-    
     achievements: list[dict] = []
 
     achievements.append({
@@ -182,26 +685,272 @@ def get_achievements() -> list[dict]:
         "username": achievements_list[4]
     })
     
-    return achievements 
+    return achievements
 
-@app.get("/api/sushi-pic")
-def get_sushi_pic():
-    headers = {
-        "Authorization": PEXELS_API_KEY
+
+async def _read_achievements() -> list[dict]:
+    """Read the achievements in a session of their own.
+
+    Returns:
+        A list of dictionaries (see get_achievements).
+    """
+
+    async with get_async_session() as session:
+        achievements_list: list[str] = await session.run_sync(
+            achievements_cache.get
+        )
+
+    return _format_achievements(achievements_list)
+
+
+@app.get("/api/achievements")
+async def get_achievements(request: Request, response: Response) -> list[dict]:
+    """Retrieve every achievement and the username that holds it.
+
+    A client holding the current version gets a 304 without the achievements
+    being computed; concurrent requests for the same version share one read.
+
+    Args:
+        request: The incoming HTTP request.
+        response: The outgoing HTTP response.
+
+    Returns:
+        A list of dictionaries with each entry containing:
+            achievement_name (str): Name of the achievement.
+            description (str): What it takes to earn the achievement.
+            emoji (str): Emoji shown next to the achievement.
+            username (str | None): Discord username of the holder.
+    """
+
+    headers: dict[str, str] = await _read_cache_headers(
+        crud_get_achievements_key()
+    )
+
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    achievements: list[dict] = await single_flight.do(
+        ("achievements", headers["ETag"]), _read_achievements
+    )
+    response.headers.update(headers)
+
+    return achievements
+
+
+def _read_dashboard(
+        session: Session, leaderboard_limit: int, history_limit: int
+) -> dict:
+    """Read the data of every dashboard widget.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        leaderboard_limit: Number of top speakers in the leaderboard.
+        history_limit: Number of entries in the history page.
+
+    Returns:
+        A dictionary containing meter, leaderboard, achievements and history
+        (see get_dashboard).
+    """
+
+    meter: int = crud_get_meter(session)
+    leaderboard: list[dict] = _format_leaderboard(
+        crud_get_leaderboard(session, limit=leaderboard_limit).all()
+    )
+    achievements: list[dict] = _format_achievements(
+        achievements_cache.get(session)
+    )
+    history: dict = _format_history_page(
+        crud_get_history_page(session, history_limit + 1), history_limit
+    )
+
+    return {
+        "meter": meter,
+        "leaderboard": leaderboard,
+        "achievements": achievements,
+        "history": history
     }
 
-    params = {
-        "query": "sushi art",
-        "per_page": 50
+
+@app.get("/api/dashboard")
+async def get_dashboard(
+        request: Request,
+        response: Response,
+        session: DbSession,
+        leaderboard_limit: int = Query(5, ge=1, le=100),
+        history_limit: int = Query(5, ge=1, le=100)
+) -> dict:
+    """Retrieve the data of every dashboard widget in one request.
+
+    Everything is read in a single session and read transaction, so the
+    widgets show one consistent snapshot of the database.
+
+    Args:
+        request: The incoming HTTP request.
+        response: The outgoing HTTP response.
+        session: A SQLAlchemy asyncio session with the database.
+        leaderboard_limit: Number of top speakers in the leaderboard.
+        history_limit: Number of entries in the history page.
+
+    Returns:
+        A dictionary containing:
+            meter (int): The Masa meter (see get_meter).
+            leaderboard (list[dict]): The top speakers (see get_leaderboard).
+            achievements (list[dict]): Every achievement (see get_achievements).
+            history (dict): The newest history page (see get_history).
+    """
+
+    await session.run_sync(begin_read)
+
+    if not_modified := await _conditional_get(
+            request, response, session, crud_get_achievements_key()
+    ):
+        return not_modified
+
+    return await session.run_sync(
+        _read_dashboard, leaderboard_limit, history_limit
+    )
+
+
+@app.get("/api/events")
+async def stream_events() -> StreamingResponse:
+    """Stream live meter, leaderboard, and history updates.
+
+    A new client first receives the current meter and full leaderboard, then
+    only changes. See api.events for the event payloads. A comment line is
+    sent every EVENTS_KEEPALIVE_INTERVAL seconds so idle proxies keep the
+    connection open.
+
+    Returns:
+        A text/event-stream response that lasts until the client disconnects.
+    """
+
+    queue: asyncio.Queue[str] = change_watcher.subscribe()
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            while True:
+                try:
+                    event: str = await asyncio.wait_for(
+                        queue.get(), EVENTS_KEEPALIVE_INTERVAL
+                    )
+                except TimeoutError:
+                    event = ": keepalive\n\n"
+
+                # Unsubscribed by the watcher: too slow or shutting down.
+                if not change_watcher.is_subscribed(queue):
+                    break
+
+                yield event
+        finally:
+            change_watcher.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.get("/api/stats")
+async def get_stats() -> dict:
+    """Report the API's internal counters.
+
+    Returns:
+        A dictionary containing:
+            achievements_cache (dict):
+                Hits, misses, and cached data version of the achievements
+                cache.
+            event_subscribers (int):
+                Number of clients connected to /api/events.
+            photo_pool (dict):
+                Size, age in seconds, and consecutive refresh failures of the
+                sushi picture pool.
+            image_cache (dict):
+                Files, bytes, and evictions of the on-disk picture cache.
+            single_flight (dict):
+                Calls, coalesced calls, and computations in flight of the
+                leaderboard and achievements endpoints.
+    """
+
+    return {
+        "achievements_cache": achievements_cache.stats(),
+        "event_subscribers": change_watcher.subscriber_count,
+        "photo_pool": photo_pool.stats(),
+        "image_cache": image_cache.stats(),
+        "single_flight": single_flight.stats()
     }
 
-    try:
-        response = requests.get(PEXELS_URL, headers=headers, params=params)
-        data = response.json()
-        photo = random.choice(data["photos"])
-        url = photo["src"]["medium"]
 
-        return {"sushi_pic_url": url}
+@app.get("/api/sushi-pic")
+async def get_sushi_pic() -> dict:
+    """Retrieve a random sushi picture from the photo pool.
+
+    Pictures in the image cache are served by /api/images; the others link
+    to Pexels directly.
+
+    Returns:
+        A dictionary containing sushi_pic_url (str), or error (str) if the
+        pool has not been filled yet.
+    """
+
+    url: str | None = photo_pool.pick()
 
-    except:
+    if url is None:
         return {"error": "Failed to fetch sushi picture from Pexels"}
+
+    name: str | None = image_cache.lookup(url)
+
+    if name is not None:
+        url = f"/api/images/{name}"
+
+    return {"sushi_pic_url": url}
+
+
+@app.get("/api/images/{name}")
+async def get_image(name: str) -> FileResponse:
+    """Serve a picture from the image cache.
+
+    The file name is the hash of the picture, so it can be cached forever.
+
+    Args:
+        name: The file name of the picture.
+
+    Returns:
+        The picture file.
+
+    Raises:
+        HTTPException: If the picture is not cached.
+    """
+
+    path: Path | None = image_cache.path(name)
+
+    if path is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    return FileResponse(path, headers={
+        "Cache-Control": "public, max-age=31536000, immutable"
+    })
+
+
+def main() -> None:
+    """Serve the API with uvicorn.
+
+    Host, port, number of worker processes, and the graceful shutdown timeout
+    are read from the API_* settings in config.py. Open /api/events streams
+    never end on their own, so they are cancelled once the timeout passes.
+
+    Returns:
+        None
+    """
+
+    uvicorn.run(
+        "api.main:app",
+        host=API_HOST,
+        port=API_PORT,
+        workers=API_WORKERS,
+        timeout_graceful_shutdown=API_SHUTDOWN_TIMEOUT
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Keep an in-memory pool of sushi pictures from the Pexels search API.
+
+A PhotoPool refreshes itself in a background task, so serving a picture is a
+random pick from memory instead of a Pexels request. When a refresh fails the
+pool keeps serving the last good set of pictures and retries sooner. Given an
+ImageCache, the pool also downloads every picture it holds after a refresh.
+
+PEXELS_URL can point at a local stub server that answers like the Pexels
+search endpoint, e.g. {"photos": [{"src": {"medium": "http://..."}}]}. The
+one in tests/pexels_stub.py is used by the tests and can be run on its own.
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+import time
+
+import httpx
+
+from api.images import ImageCache
+
+from config import (
+    PEXELS_API_KEY, PEXELS_PER_PAGE, PEXELS_QUERY, PEXELS_REFRESH_INTERVAL,
+    PEXELS_RETRY_INTERVAL, PEXELS_TIMEOUT, PEXELS_URL
+)
+
+
+class PhotoPool:
+    """Cache picture URLs from a Pexels search and refresh them on a schedule.
+
+    Attributes:
+        url: The Pexels search endpoint.
+        api_key: The Pexels API key.
+        query: The search query.
+        per_page: Number of pictures requested per refresh.
+        timeout: Seconds before a Pexels request is abandoned.
+        refresh_interval: Seconds between refreshes after a success.
+        retry_interval: Seconds between refreshes after a failure.
+        image_cache: Cache the pictures are downloaded into, if any.
+        logger: Logger object that logs events from this pool.
+    """
+
+    def __init__(
+            self,
+            url: str = PEXELS_URL,
+            api_key: str | None = PEXELS_API_KEY,
+            query: str = PEXELS_QUERY,
+            per_page: int = PEXELS_PER_PAGE,
+            timeout: float = PEXELS_TIMEOUT,
+            refresh_interval: float = PEXELS_REFRESH_INTERVAL,
+            retry_interval: float = PEXELS_RETRY_INTERVAL,
+            image_cache: ImageCache | None = None
+    ):
+        """Initialize an empty pool.
+
+        Args:
+            url: The Pexels search endpoint.
+            api_key: The Pexels API key.
+            query: The search query.
+            per_page: Number of pictures requested per refresh.
+            timeout: Seconds before a Pexels request is abandoned.
+            refresh_interval: Seconds between refreshes after a success.
+            retry_interval: Seconds between refreshes after a failure.
+            image_cache: Cache the pictures are downloaded into, if any.
+        """
+
+        self.url: str = url
+        self.api_key: str | None = api_key
+        self.query: str = query
+        self.per_page: int = per_page
+        self.timeout: float = timeout
+        self.refresh_interval: float = refresh_interval
+        self.retry_interval: float = retry_interval
+        self.image_cache: ImageCache | None = image_cache
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+        self.photos: list[str] = []
+        self.refreshed_at: float | None = None
+        self.failures: int = 0
+
+        self._client: httpx.AsyncClient | None = None
+        self._task: asyncio.Task | None = None
+
+    def pick(self) -> str | None:
+        """Pick a random picture from the pool.
+
+        Returns:
+            The URL of a picture, or None if no refresh has succeeded yet.
+        """
+
+        if not self.photos:
+            return None
+
+        return random.choice(self.photos)
+
+    def stats(self) -> dict:
+        """Report the state of the pool.
+
+        Returns:
+            A dictionary containing:
+                size (int): Number of pictures in the pool.
+                age (float | None): Seconds since the last good refresh.
+                failures (int): Consecutive failed refreshes.
+        """
+
+        age: float | None = None
+
+        if self.refreshed_at is not None:
+            age = round(time.monotonic() - self.refreshed_at, 1)
+
+        return {"size": len(self.photos), "age": age, "failures": self.failures}
+
+    async def refresh(self) -> int:
+        """Replace the pool with a fresh Pexels search.
+
+        The pool is left untouched if the request fails or returns no
+        pictures.
+
+        Returns:
+            The int number of pictures in the new pool.
+
+        Raises:
+            httpx.HTTPError: If the request fails or times out.
+            ValueError: If the response has no usable pictures.
+        """
+
+        client: httpx.AsyncClient = self._client or httpx.AsyncClient(
+            timeout=self.timeout
+        )
+
+        try:
+            response: httpx.Response = await client.get(
+                self.url,
+                headers={"Authorization": self.api_key or ""},
+                params={"query": self.query, "per_page": self.per_page}
+            )
+            response.raise_for_status()
+            data: dict = response.json()
+        finally:
+            if client is not self._client:
+                await client.aclose()
+
+        photos: list[str] = [
+            photo["src"]["medium"]
+            for photo in data.get("photos", [])
+            if photo.get("src", {}).get("medium")
+        ]
+
+        if not photos:
+            raise ValueError("Pexels returned no pictures")
+
+        self.photos = photos
+        self.refreshed_at = time.monotonic()
+
+        return len(photos)
+
+    def start(self) -> None:
+        """Start refreshing in a background task.
+
+        Returns:
+            None
+        """
+
+        self._client = httpx.AsyncClient(timeout=self.timeout)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop refreshing and close the HTTP client.
+
+        Returns:
+            None
+        """
+
+        if self._task is not None:
+            self._task.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+            self._task = None
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _run(self) -> None:
+        """Refresh the pool forever.
+
+        Returns:
+            None
+        """
+
+        while True:
+            try:
+                count: int = await self.refresh()
+                self.failures = 0
+                self.logger.info("Refreshed photo pool with %d pictures", count)
+                delay: float = self.refresh_interval
+            except Exception as e:
+                self.failures += 1
+                self.logger.warning(
+                    "Failed to refresh photo pool (keeping %d pictures): %r",
+                    len(self.photos), e
+                )
+                delay = self.retry_interval
+
+            if self.image_cache is not None and self.photos:
+                cached: int = await self.image_cache.fetch_all(
+                    self._client, self.photos
+                )
+                self.logger.info(
+                    "%d of %d pictures are cached", cached, len(self.photos)
+                )
+
+            await asyncio.sleep(delay)
@@ -0,0 +1,116 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Share one in-flight computation between concurrent identical requests.
+
+When many clients ask for the same thing at the same moment, for example
+after every open dashboard reconnects at once, a SingleFlight runs the
+computation for the first request only. The requests that arrive while it is
+running wait for the same result instead of repeating the work.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key.
+
+    Results are not cached: once a computation finishes, the next call with
+    its key starts a new one.
+
+    Attributes:
+        calls: Number of calls to do.
+        coalesced: Number of calls that joined a computation already running.
+    """
+
+    def __init__(self):
+        """Initialize with no computations in flight."""
+
+        self.calls: int = 0
+        self.coalesced: int = 0
+
+        self._flights: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, compute: Callable[[], Awaitable[T]]) -> T:
+        """Run compute, or wait for the running computation with the same key.
+
+        The computation runs in its own task, so a caller that is cancelled
+        (e.g. the client disconnected) does not cancel it for the others.
+
+        Args:
+            key: Identifies calls that can share a result.
+            compute: Starts the computation. Only called if no computation
+                with key is in flight.
+
+        Returns:
+            The result of the computation.
+
+        Raises:
+            Exception: Whatever the computation raised, to every caller.
+        """
+
+        self.calls += 1
+        task: asyncio.Task[T] | None = self._flights.get(key)
+
+        if task is None:
+            task = asyncio.create_task(compute())
+            task.add_done_callback(lambda done: self._land(key, done))
+            self._flights[key] = task
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        """Report the coalescing counters.
+
+        Returns:
+            A dictionary containing calls, coalesced, and in_flight.
+        """
+
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._flights)
+        }
+
+    def _land(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished computation.
+
+        Args:
+            key: The key of the computation.
+            task: The finished task.
+
+        Returns:
+            None
+        """
+
+        if self._flights.get(key) is task:
+            del self._flights[key]
+
+        # Mark the exception as retrieved in case every caller went away.
+        if not task.cancelled():
+            task.exception()
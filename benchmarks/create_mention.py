@@ -0,0 +1,144 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Compare the per-mention latency of create_mention, add_mention, and
+add_mentions.
+
+create_mention and add_mention write one mention per call, and commit each
+one; add_mentions writes a batch per call, as the mention queue does, and its
+latency is reported per mention. Each function writes to a fresh SQLite
+database in a temporary directory, using the same engine settings as the
+application. The speakers cycle through a small pool so both the new-speaker
+and existing-speaker paths are exercised.
+
+Every commit waits for the disk, so on a slow disk the single-mention
+functions are dominated by the commit and differ little.
+
+Examples:
+    python -m benchmarks.create_mention
+    python -m benchmarks.create_mention --mentions 5000 --speakers 50
+    python -m benchmarks.create_mention --batch 100
+"""
+
+import argparse
+from pathlib import Path
+import statistics
+import tempfile
+import time
+from typing import Callable
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from db.crud import add_mention, add_mentions, create_mention
+from db.database import Base, create_db_engine
+import db.models  # noqa: F401  Registers the tables on Base.metadata.
+
+
+def _run(
+        write: Callable[[Session, list[str]], object],
+        path: Path,
+        mentions: int,
+        speakers: int,
+        batch: int
+) -> list[float]:
+    """Time write for every batch of mentions against a new database file.
+
+    Args:
+        write: Writes a list of mentions given by speaker username.
+        path: The path of the database file to create.
+        mentions: Number of mentions to write.
+        speakers: Number of distinct speaker usernames.
+        batch: Number of mentions per call.
+
+    Returns:
+        The latency of every call divided by batch, in microseconds.
+    """
+
+    engine: Engine = create_db_engine(path)
+    Base.metadata.create_all(engine)
+    SessionLocal: sessionmaker[Session] = sessionmaker(
+        autoflush=False, bind=engine
+    )
+    latencies: list[float] = []
+
+    with SessionLocal() as session:
+        for first in range(0, mentions, batch):
+            usernames: list[str] = [
+                f"speaker{i % speakers}"
+                for i in range(first, min(first + batch, mentions))
+            ]
+            start: int = time.perf_counter_ns()
+            write(session, usernames)
+            latencies.append(
+                (time.perf_counter_ns() - start) / 1000 / len(usernames)
+            )
+
+    engine.dispose()
+
+    return latencies
+
+
+def main() -> None:
+    """Run the benchmark and print a latency summary for each function.
+
+    Returns:
+        None
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--mentions", type=int, default=2000)
+    parser.add_argument("--speakers", type=int, default=20)
+    parser.add_argument("--batch", type=int, default=50)
+    args: argparse.Namespace = parser.parse_args()
+
+    # (name, write, mentions per call)
+    runs: list[tuple[str, Callable[[Session, list[str]], object], int]] = [
+        ("create_mention", lambda s, names: create_mention(s, names[0]), 1),
+        ("add_mention", lambda s, names: add_mention(s, names[0]), 1),
+        ("add_mentions", add_mentions, args.batch),
+    ]
+
+    print(
+        f"{args.mentions} mentions, {args.speakers} speakers, "
+        f"add_mentions batches of {args.batch} (us/mention)"
+    )
+    print(f"{'function':<16}{'mean':>10}{'p50':>10}{'p99':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, write, batch in runs:
+            latencies: list[float] = _run(
+                write, Path(tmp) / f"{name}.db",
+                args.mentions, args.speakers, batch
+            )
+            p99: float = statistics.quantiles(latencies, n=100)[98]
+
+            print(
+                f"{name:<16}"
+                f"{statistics.fmean(latencies):>10.1f}"
+                f"{statistics.median(latencies):>10.1f}"
+                f"{p99:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
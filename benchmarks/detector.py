@@ -0,0 +1,303 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Measure the speed and accuracy of the "Sushi Masa" mention detector.
+
+The detector runs over synthetic message categories that stress different
+costs:
+
+    short: Short chat messages, the common case on a busy server.
+    long: Multi-kilobyte pastes.
+    adversarial: Inputs built to make a backtracking regex go quadratic.
+    leetspeak: Generated spelling variants that should all be detected.
+
+For each category the benchmark prints messages per second and the worst
+single-message latency. It then scores the detector against the labeled
+samples in benchmarks/data/detector_corpus.jsonl and the generated leetspeak
+variants, and lists every misclassified sample. With --legacy, the
+expression that on_message used before bot.utils.detector is measured too.
+
+Examples:
+    python -m benchmarks.detector
+    python -m benchmarks.detector --legacy --adversarial-length 2000
+"""
+
+import argparse
+import json
+from pathlib import Path
+import random
+import re
+import time
+from typing import Callable
+
+from bot.utils.detector import is_mention
+
+
+CORPUS_PATH: Path = (
+    Path(__file__).resolve().parent / "data" / "detector_corpus.jsonl"
+)
+
+# The expression on_message compiled for every message before the detector.
+LEGACY_PATTERN: re.Pattern = re.compile(
+    r"[s$5z]+[\s_-]*[uv]+[\s_-]*[s$5z]+[\s_-]*[h#4]+[\s_-]*[i1!l]+"
+    r"[\s\S]*"
+    r"m+[\s_-]*[a@4]+[\s_-]*[s$5z]+[\s_-]*[a@4]+"
+    r"|m+[\s_-]*[a@4]+[\s_-]*[s$5z]+[\s_-]*[a@4]+",
+    re.I
+)
+
+WORDS: list[str] = (
+    "the a to and i you it is lol that for on in this was my we so of what "
+    "just like be have do not but are with gg get can yeah no ok game today "
+    "tonight food ramen pizza stream link discord server play who when good "
+    "time need dinner lunch hungry tomorrow later sure nice bro omg wait"
+).split()
+
+LEET: dict[str, list[str]] = {
+    "s": ["s", "S", "$", "5", "z", "Z"],
+    "u": ["u", "U", "v", "V"],
+    "h": ["h", "H", "#", "4"],
+    "i": ["i", "I", "1", "!", "l"],
+    "m": ["m", "M"],
+    "a": ["a", "A", "@", "4"],
+}
+
+
+def _legacy(content: str) -> bool:
+    """Detect a mention with the legacy expression.
+
+    Args:
+        content: The text of the message.
+
+    Returns:
+        True if the legacy expression matches.
+    """
+
+    return LEGACY_PATTERN.search(content) is not None
+
+
+def _chat(rng: random.Random, words: int) -> str:
+    """Build a chat message out of common words.
+
+    Args:
+        rng: The random number generator.
+        words: Number of words.
+
+    Returns:
+        The message.
+    """
+
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _leet(rng: random.Random, word: str) -> str:
+    """Spell a word with random substitutions, repeats, and separators.
+
+    Args:
+        rng: The random number generator.
+        word: The word, made of letters in LEET.
+
+    Returns:
+        The respelled word.
+    """
+
+    letters: list[str] = [
+        rng.choice(LEET[letter]) * rng.randint(1, 3) for letter in word
+    ]
+
+    return rng.choice(["", "", " ", "_", "-"]).join(letters)
+
+
+def _leet_mentions(rng: random.Random, count: int) -> list[str]:
+    """Generate chat messages that mention Sushi Masa in leetspeak.
+
+    Args:
+        rng: The random number generator.
+        count: Number of messages.
+
+    Returns:
+        The messages.
+    """
+
+    messages: list[str] = []
+
+    for _ in range(count):
+        mention: str = _leet(rng, "masa")
+
+        if rng.random() < 0.7:
+            separator: str = rng.choice([" ", "", "\n", "... "])
+            mention = _leet(rng, "sushi") + separator + mention
+
+        messages.append(
+            f"{_chat(rng, rng.randint(0, 5))} {mention} "
+            f"{_chat(rng, rng.randint(0, 5))}".strip()
+        )
+
+    return messages
+
+
+def _categories(
+        rng: random.Random, messages: int, adversarial_length: int
+) -> dict[str, list[str]]:
+    """Build the synthetic message categories.
+
+    Args:
+        rng: The random number generator.
+        messages: Number of short chat messages.
+        adversarial_length: Length of the adversarial inputs.
+
+    Returns:
+        A dictionary mapping each category name to its messages.
+    """
+
+    n: int = adversarial_length
+
+    return {
+        "short": [_chat(rng, rng.randint(1, 12)) for _ in range(messages)],
+        "long": [_chat(rng, 800) for _ in range(max(messages // 100, 1))],
+        "adversarial": [
+            "m" * n,
+            "M" * n,
+            "sushi " + "m" * n,
+            "sushi" + " " * n + "x",
+            "sushi " + "ma " * (n // 3),
+            "m_" * (n // 2),
+            "ma" * (n // 2),
+            "s" * n + "h" * n,
+            ("sushi " * (n // 6)) + "mas",
+        ],
+        "leetspeak": _leet_mentions(rng, messages // 4),
+    }
+
+
+def _time(
+        detect: Callable[[str], bool], messages: list[str]
+) -> tuple[float, float]:
+    """Run a detector over every message.
+
+    Args:
+        detect: The detector.
+        messages: The messages.
+
+    Returns:
+        A tuple in the form (messages per second, worst latency in us).
+    """
+
+    total: int = 0
+    worst: int = 0
+
+    for message in messages:
+        start: int = time.perf_counter_ns()
+        detect(message)
+        elapsed: int = time.perf_counter_ns() - start
+        total += elapsed
+        worst = max(worst, elapsed)
+
+    return len(messages) / (total / 1e9), worst / 1000
+
+
+def _load_corpus(path: Path) -> list[tuple[str, bool]]:
+    """Read the labeled samples.
+
+    Args:
+        path: A JSON Lines file of {"text": str, "label": bool} objects.
+
+    Returns:
+        A list of (text, label) tuples.
+    """
+
+    with path.open(encoding="utf-8") as file:
+        return [
+            (sample["text"], sample["label"])
+            for sample in map(json.loads, file) if sample
+        ]
+
+
+def main() -> None:
+    """Run the benchmark and print speed and accuracy for each detector.
+
+    Returns:
+        None
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--adversarial-length", type=int, default=20000)
+    parser.add_argument("--legacy", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args: argparse.Namespace = parser.parse_args()
+
+    rng: random.Random = random.Random(args.seed)
+    categories: dict[str, list[str]] = _categories(
+        rng, args.messages, args.adversarial_length
+    )
+    labeled: list[tuple[str, bool]] = _load_corpus(CORPUS_PATH) + [
+        (message, True) for message in _leet_mentions(rng, 500)
+    ]
+    detectors: dict[str, Callable[[str], bool]] = {"detector": is_mention}
+
+    if args.legacy:
+        detectors["legacy"] = _legacy
+
+    print(
+        f"{'detector':<10}{'category':<13}{'messages':>9}{'msg/s':>13}"
+        f"{'worst us':>12}"
+    )
+
+    for name, detect in detectors.items():
+        for category, messages in categories.items():
+            rate: float
+            worst: float
+            rate, worst = _time(detect, messages)
+
+            print(
+                f"{name:<10}{category:<13}{len(messages):>9}"
+                f"{rate:>13,.0f}{worst:>12,.1f}"
+            )
+
+    print(f"\n{len(labeled)} labeled samples")
+    print(f"{'detector':<10}{'TP':>6}{'FP':>6}{'FN':>6}{'TN':>6}")
+
+    for name, detect in detectors.items():
+        counts: dict[tuple[bool, bool], int] = {
+            (True, True): 0, (True, False): 0,
+            (False, True): 0, (False, False): 0
+        }
+        misses: list[str] = []
+
+        for text, label in labeled:
+            detected: bool = detect(text)
+            counts[(detected, label)] += 1
+
+            if detected != label:
+                kind: str = "FP" if detected else "FN"
+                misses.append(f"    {kind} {text!r}")
+
+        print(
+            f"{name:<10}{counts[(True, True)]:>6}{counts[(True, False)]:>6}"
+            f"{counts[(False, True)]:>6}{counts[(False, False)]:>6}"
+        )
+        print("\n".join(misses))
+
+
+if __name__ == "__main__":
+    main()
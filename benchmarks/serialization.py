@@ -0,0 +1,199 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Compare FastAPI's default JSON serialization with api.encoding.
+
+Both paths turn the same in-memory rows into response bytes. The default path
+builds a dict per row and renders it the way FastAPI does for a returned
+object (jsonable_encoder, then JSONResponse); the fast path encodes the row
+tuples directly. The outputs are checked to be identical before timing.
+
+Examples:
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --rows 500000 --repeat 3
+"""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+import time
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from api.encoding import encode_history, encode_leaderboard
+
+
+def _history_rows(rows: int) -> list[tuple[str, str]]:
+    """Build history rows in the form (date, speaker_username).
+
+    Args:
+        rows: Number of rows.
+
+    Returns:
+        The rows.
+    """
+
+    start: datetime = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    return [
+        ((start + timedelta(seconds=i)).isoformat(), f"speaker{i % 50}")
+        for i in range(rows)
+    ]
+
+
+def _leaderboard_rows(rows: int) -> list[tuple[str, int]]:
+    """Build leaderboard rows in the form (speaker_username, count).
+
+    Args:
+        rows: Number of rows.
+
+    Returns:
+        The rows.
+    """
+
+    return [(f"speaker{i}", rows - i) for i in range(rows)]
+
+
+def _default_history(rows: list[tuple[str, str]]) -> bytes:
+    """Render history rows through FastAPI's default path.
+
+    Args:
+        rows: The rows to serialize.
+
+    Returns:
+        The response body.
+    """
+
+    history: list[dict] = [
+        {"date": date, "username": username} for date, username in rows
+    ]
+
+    return JSONResponse(jsonable_encoder(history)).body
+
+
+def _fast_history(rows: list[tuple[str, str]]) -> bytes:
+    """Render history rows through api.encoding.
+
+    Args:
+        rows: The rows to serialize.
+
+    Returns:
+        The response body.
+    """
+
+    return encode_history(rows).encode()
+
+
+def _default_leaderboard(rows: list[tuple[str, int]]) -> bytes:
+    """Render leaderboard rows through FastAPI's default path.
+
+    Args:
+        rows: The rows to serialize.
+
+    Returns:
+        The response body.
+    """
+
+    leaderboard: list[dict] = [
+        {"username": username, "count": count} for username, count in rows
+    ]
+
+    return JSONResponse(jsonable_encoder(leaderboard)).body
+
+
+def _fast_leaderboard(rows: list[tuple[str, int]]) -> bytes:
+    """Render leaderboard rows through api.encoding.
+
+    Args:
+        rows: The rows to serialize.
+
+    Returns:
+        The response body.
+    """
+
+    return encode_leaderboard(rows).encode()
+
+
+def _best_of(encode: Callable[[list], bytes], rows: list, repeat: int) -> float:
+    """Time encode on rows and keep the fastest run.
+
+    Args:
+        encode: The serialization function.
+        rows: The rows to serialize.
+        repeat: Number of runs.
+
+    Returns:
+        The fastest run in milliseconds.
+    """
+
+    best: float = float("inf")
+
+    for _ in range(repeat):
+        start: int = time.perf_counter_ns()
+        encode(rows)
+        best = min(best, (time.perf_counter_ns() - start) / 1e6)
+
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print the serialization time of each path.
+
+    Returns:
+        None
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args: argparse.Namespace = parser.parse_args()
+
+    cases: list[tuple[str, list, Callable, Callable]] = [
+        (
+            "history", _history_rows(args.rows),
+            _default_history, _fast_history
+        ),
+        (
+            "leaderboard", _leaderboard_rows(args.rows),
+            _default_leaderboard, _fast_leaderboard
+        ),
+    ]
+
+    print(f"{args.rows} rows, best of {args.repeat} (ms)")
+    print(f"{'payload':<14}{'default':>10}{'fast':>10}{'speedup':>10}")
+
+    for name, rows, default, fast in cases:
+        if default(rows) != fast(rows):
+            raise AssertionError(f"{name}: outputs differ")
+
+        default_ms: float = _best_of(default, rows, args.repeat)
+        fast_ms: float = _best_of(fast, rows, args.repeat)
+
+        print(
+            f"{name:<14}{default_ms:>10.1f}{fast_ms:>10.1f}"
+            f"{default_ms / fast_ms:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
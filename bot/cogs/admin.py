@@ -22,19 +22,21 @@
 
 """Handle admin commands relating the Discord bot.
 
-Provides slash commands for shutting down the bot and reloading the bot for
+Provides slash commands for shutting down the bot, reloading the bot for
 files changes inside cog extensions so developers do not have to shut down the
-bot.
+bot, and backfilling mentions from channel history.
 """
 
+import asyncio
 import logging
 
-from discord import Interaction, app_commands
+from discord import HTTPException, Interaction, app_commands
 from discord.ext import commands
 
-from config import DEV_GUILD_ID
+from config import BACKFILL_PROGRESS_INTERVAL, DEV_GUILD_ID
 
 from bot.main import MasaBot
+from bot.utils.backfill import Backfill
 
 
 class Admin(commands.Cog):
@@ -42,11 +44,13 @@ class Admin(commands.Cog):
 
     Attributes:
         bot: The Discord bot instance this cog is attached to.
+        backfill: The backfill that is running, if any.
         logger: Logger object that logs events from this cog.
     """
 
     def __init__(self, bot: MasaBot):
         self.bot: MasaBot = bot
+        self.backfill: Backfill | None = None
         self.logger: logging.Logger = logging.getLogger(__name__)
 
     @app_commands.guilds(DEV_GUILD_ID)
@@ -104,6 +108,104 @@ class Admin(commands.Cog):
                 "Error reloading cogs!", ephemeral=True
             )
 
+    @app_commands.guilds(DEV_GUILD_ID)
+    @app_commands.command(
+        name="backfill",
+        description="Count mentions from channel history (owner only)",
+    )
+    @commands.is_owner()
+    async def backfill_history(self, interaction: Interaction) -> None:
+        """Backfill mentions from the history of every text channel.
+
+        Each channel resumes from its saved checkpoint, so running the command
+        again only scans messages sent since the last backfill. Progress is
+        shown in the response until the backfill finishes. (Owner-only
+        command)
+
+        Args:
+            interaction (Interaction): Discord command interaction.
+
+        Returns:
+            None
+
+        Examples:
+            /backfill
+        """
+
+        if not await self.bot.is_owner(interaction.user):
+            await interaction.response.send_message(
+                "Only the owner can backfill!", ephemeral=True
+            )
+            return
+
+        if self.backfill is not None:
+            await interaction.response.send_message(
+                f"A backfill is already running: {self.backfill.progress()}",
+                ephemeral=True
+            )
+            return
+
+        self.backfill = Backfill(self.bot)
+        self.logger.info("Backfill started")
+        await interaction.response.send_message(
+            "Backfill started!", ephemeral=True
+        )
+
+        task: asyncio.Task = asyncio.create_task(self.backfill.run())
+        editable: bool = True
+
+        try:
+            while not task.done():
+                await asyncio.wait({task}, timeout=BACKFILL_PROGRESS_INTERVAL)
+
+                if task.done():
+                    break
+
+                if editable:
+                    editable = await self._show_progress(
+                        interaction, f"Backfilling: {self.backfill.progress()}"
+                    )
+                else:
+                    self.logger.info(
+                        f"Backfilling: {self.backfill.progress()}"
+                    )
+
+            await task
+
+            if editable:
+                await self._show_progress(
+                    interaction, f"Backfill done: {self.backfill.progress()}"
+                )
+        except Exception as e:
+            self.logger.exception("Error backfilling: %s", e)
+
+            if editable:
+                await self._show_progress(interaction, "Error backfilling!")
+        finally:
+            self.backfill = None
+            self.bot.presence.notify()
+
+    async def _show_progress(
+            self, interaction: Interaction, content: str
+    ) -> bool:
+        """Replace the response of an interaction with a progress message.
+
+        Args:
+            interaction (Interaction): Discord command interaction.
+            content: The message to show.
+
+        Returns:
+            True if the response was edited; otherwise False, for example
+            once the interaction token has expired.
+        """
+
+        try:
+            await interaction.edit_original_response(content=content)
+            return True
+        except HTTPException as e:
+            self.logger.warning("Cannot show backfill progress: %s", e)
+            return False
+
 
 async def setup(bot: MasaBot) -> None:
     """Load the Admin cog into the bot.
@@ -28,22 +28,23 @@ the meter for a specified user and to display the leaderboard with a custom UI.
 """
 
 import logging
-import re
 
 from discord import Interaction, Member, Message, app_commands
 from discord.ui import View
 from discord.ext import commands
 
-from sqlalchemy import Result
+from sqlalchemy import Row
 
 from bot.main import MasaBot
 from bot.ui.help_ui import HelpUI
 from bot.ui.info_ui import InfoUI
 from bot.ui.leaderboard_ui import LeaderboardUI
 from bot.utils.config_loader import command_guild_scope
+from bot.utils.detector import is_mention
+from bot.utils.rate_limiter import Decision, MentionRateLimiter
 
-from db.crud import create_mention, get_leaderboard
-from db.database import get_session
+from db.async_crud import get_leaderboard
+from db.database import get_async_session
 
 
 class MessageHandler(commands.Cog):
@@ -52,6 +53,7 @@ class MessageHandler(commands.Cog):
 
     Attributes:
         bot: The Discord bot instance this cog is attached to.
+        rate_limiter: Decides whether detected mentions are counted.
         logger: Logger object that logs events from this cog.
     """
 
@@ -63,6 +65,7 @@ class MessageHandler(commands.Cog):
         """
 
         self.bot: MasaBot = bot
+        self.rate_limiter: MentionRateLimiter = MentionRateLimiter()
         self.logger: logging.Logger = logging.getLogger(__name__)
 
     @commands.Cog.listener()
@@ -81,7 +84,8 @@ class MessageHandler(commands.Cog):
             meter.
 
         Ignores messages sent by the bot itself. Increments the meter when a
-        match is found and replies to confirm.
+        match is found and replies to confirm, as far as the rate limiter
+        allows (see bot.utils.rate_limiter).
 
         Args:
             message: Discord message object retrieved from the text channel.
@@ -93,20 +97,21 @@ class MessageHandler(commands.Cog):
         if message.author == self.bot.user:
             return
 
-        # Regex to search for numerous variations of "Sushi Masa" in a message.
-        expr: str = (
-            r"[s$5z]+[\s_-]*[uv]+[\s_-]*[s$5z]+[\s_-]*[h#4]+[\s_-]*[i1!l]+"
-            r"[\s\S]*"
-            r"m+[\s_-]*[a@4]+[\s_-]*[s$5z]+[\s_-]*[a@4]+"
-            r"|m+[\s_-]*[a@4]+[\s_-]*[s$5z]+[\s_-]*[a@4]+"
+        if not is_mention(message.content):
+            return
+
+        decision: Decision = self.rate_limiter.check(
+            message.author.id, message.channel.id
         )
-        pattern: re.Pattern = re.compile(expr, re.I)
 
-        if pattern.search(message.content):
-            with get_session() as session:
-                create_mention(session, message.author.name)
+        if decision is Decision.IGNORE:
+            self.logger.info(f"Rate limited {message.author.name}")
+            return
+
+        self.bot.mention_queue.put(message.author.name, message.id)
+        self.logger.info(f"{message.author.name} said Sushi Masa")
 
-            self.logger.info(f"{message.author.name} said Sushi Masa")
+        if decision is Decision.COUNT:
             await message.reply("Masa Meter has gone up!")
 
     @command_guild_scope
@@ -159,8 +164,8 @@ class MessageHandler(commands.Cog):
     ) -> None:
         """Increments the meter manually for a specified user.
 
-        Connects with the database, increments the meter, and replies to confirm
-        the increment.
+        Queues the mention for the database, and replies to confirm the
+        increment.
 
         Args:
             interaction: Discord command interaction.
@@ -170,8 +175,7 @@ class MessageHandler(commands.Cog):
             None
         """
 
-        with get_session() as session:
-            create_mention(session, speaker.name)
+        self.bot.mention_queue.put(speaker.name, interaction.id)
 
         self.logger.info(f"{speaker.name} said Sushi Masa")
         await interaction.response.send_message(
@@ -195,8 +199,8 @@ class MessageHandler(commands.Cog):
             None
         """
 
-        with get_session() as session:
-            results: Result = get_leaderboard(session)
+        async with get_async_session() as session:
+            results: list[Row] = await get_leaderboard(session)
 
         leaderboard_ui: View = LeaderboardUI(results)
 
@@ -42,31 +42,45 @@ import signal
 import discord
 from discord.ext import commands, tasks
 
-from config import COGS_DIR
+from config import COGS_DIR, PRESENCE_RECONCILE_INTERVAL
 
 from bot.utils.config_loader import BOT_TOKEN, tree_sync
 from bot.utils.logger import app_logger
+from bot.utils.mention_queue import MentionQueue
+from bot.utils.presence import PresenceUpdater
 
-from db.crud import get_meter
-from db.database import get_session
+from db.database import async_engine
 
 
 class MasaBot(commands.Bot):
-    """
+    """Discord bot that tracks the Sushi Masa Meter.
+
+    Attributes:
+        presence: Shows the meter as the bot's presence when it changes.
+        mention_queue: Write-behind queue that batches detected mentions.
     """
 
     def __init__(self, command_prefix, intents):
         super().__init__(command_prefix=command_prefix, intents=intents)
 
+        self.presence: PresenceUpdater = PresenceUpdater(self)
+        self.mention_queue: MentionQueue = MentionQueue(
+            on_flush=self.presence.notify
+        )
+
     async def on_ready(self) -> None:
-        """Log bot connection and start the background status update task.
+        """Log bot connection, show the meter, and start the status
+        reconciliation task.
 
         Returns:
             None
         """
 
         app_logger.info("Masa Meter is connected to Discord!")
-        self.update_bot_status.start()
+        await self.presence.update(force=True)
+
+        if not self.reconcile_bot_status.is_running():
+            self.reconcile_bot_status.start()
 
         await tree_sync(self.tree)
 
@@ -75,11 +89,23 @@ class MasaBot(commands.Bot):
     async def shutdown(self) -> None:
         """Shut down the bot "safely" and logs it.
 
+        Flushes the mention queue before disconnecting so buffered mentions are
+        not lost, and shows the final meter as the presence.
+
         Returns:
             None
         """
 
         app_logger.info("Masa Meter is shutting down!")
+        self.reconcile_bot_status.cancel()
+
+        if await self.mention_queue.close():
+            try:
+                await self.presence.update()
+            except Exception as e:
+                app_logger.exception("Error updating presence: %s", e)
+
+        self.presence.close()
         await self.close()
 
     async def load_cogs(self) -> None:
@@ -109,23 +135,22 @@ class MasaBot(commands.Bot):
         except Exception:
             raise
 
-    @tasks.loop(seconds=5)
-    async def update_bot_status(self) -> None:
-        """Update the bot's Discord status with the current Sushi Masa Meter
+    @tasks.loop(seconds=PRESENCE_RECONCILE_INTERVAL)
+    async def reconcile_bot_status(self) -> None:
+        """Update the bot's Discord status if the meter changed elsewhere.
+
+        Mentions written by this bot update the status right away (see
+        PresenceUpdater). This slow loop picks up changes made by other
+        processes.
 
         Returns:
             None
         """
 
-        # Polling every 5 seconds to avoid complex event-driven logic.
-
-        with get_session() as session:
-            meter: int = get_meter(session)
-
-        await self.change_presence(activity=discord.Activity(
-            type=discord.ActivityType.watching,
-            name=f"Sushi Masa Meter: {meter}"
-        ))
+        try:
+            await self.presence.update()
+        except Exception as e:
+            app_logger.exception(f"Error reconciling bot status: {e}")
 
 
 async def main() -> None:
@@ -157,5 +182,9 @@ async def main() -> None:
         await bot.load_cogs()
         await bot.start(BOT_TOKEN)
 
+    # Mentions received while the bot was disconnecting.
+    await bot.mention_queue.close()
+    await async_engine.dispose()
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -22,7 +22,7 @@
 
 """Render a Discord leaderboard UI with results from a SQLAlchemy query.
 
-Format the top five usernames and scores from a SQLAlchemy Result object into a
+Format the top five usernames and scores from a list of SQLAlchemy rows into a
 Discord embed with medal emojis representing the place. Provide a Discord UI
 view that can show the leaderboard in response to an interaction.
 """
@@ -30,7 +30,7 @@ view that can show the leaderboard in response to an interaction.
 import discord
 from discord import Interaction
 
-from sqlalchemy import Result
+from sqlalchemy import Row
 
 
 class LeaderboardUI(discord.ui.View):
@@ -45,12 +45,12 @@ class LeaderboardUI(discord.ui.View):
             A Discord embed containing the contents of the leaderboard.
     """
 
-    def __init__(self, results: Result):
+    def __init__(self, results: list[Row]):
         """Initialize the leaderboard view.
 
         Args:
             results:
-                A SQLAlchemy Result object containing the leaderboard
+                A list of SQLAlchemy rows containing the leaderboard
                 (username, score).
         """
 
@@ -74,12 +74,12 @@ class LeaderboardUI(discord.ui.View):
             value=self.results_to_embed(results)
         )
 
-    def results_to_embed(self, results: Result) -> str:
+    def results_to_embed(self, results: list[Row]) -> str:
         """Convert top 5 leaderboard results into a formatted embed.
 
         Args:
             results:
-                A SQLAlchemy Result object containing the leaderboard
+                A list of SQLAlchemy rows containing the leaderboard
                 (username, score).
 
         Returns:
@@ -0,0 +1,285 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Scan channel history for mentions that were never counted.
+
+Mentions said while the bot was offline are only found by reading the channel
+history. The Backfill scans every readable text channel oldest message first,
+a few channels at a time, and runs the mention detector on each message. The
+mentions found are written together with a checkpoint of the newest message
+scanned, in one transaction per batch, so a backfill that is interrupted
+resumes where it stopped. Mentions are keyed by message id, so messages the
+bot already counted live are not counted twice. Mentions counted before they
+recorded a message id cannot be matched that way, so the history from the
+first of them until message ids were recorded (see db.migrate) is skipped.
+Mentions go through the same rate limit as live ones, so a spam burst the bot
+ignored is not counted either.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+import discord
+
+from config import BACKFILL_BATCH_SIZE, BACKFILL_CONCURRENCY
+
+from bot.utils.detector import is_mention
+from bot.utils.rate_limiter import Decision, MentionRateLimiter
+from db.async_crud import (
+    add_backfill_batch, get_backfill_checkpoints, get_untracked_window
+)
+from db.database import get_async_session
+
+
+class Backfill:
+    """Backfill mentions from the history of a client's text channels.
+
+    Attributes:
+        client: The Discord client whose channels are scanned.
+        concurrency: Number of channels scanned at the same time.
+        batch_size: Number of scanned messages written per transaction.
+        channels: Number of channels to scan.
+        channels_done: Number of channels scanned to the end.
+        scanned: Number of messages scanned.
+        found: Number of mentions added.
+        errors: Number of channels whose scan failed.
+        logger: Logger object that logs events from this backfill.
+    """
+
+    def __init__(
+            self,
+            client: discord.Client,
+            concurrency: int = BACKFILL_CONCURRENCY,
+            batch_size: int = BACKFILL_BATCH_SIZE
+    ):
+        """Initialize a backfill that has not started.
+
+        Args:
+            client: The Discord client whose channels are scanned.
+            concurrency: Number of channels scanned at the same time.
+            batch_size: Number of scanned messages written per transaction.
+        """
+
+        self.client: discord.Client = client
+        self.concurrency: int = concurrency
+        self.batch_size: int = batch_size
+        self.channels: int = 0
+        self.channels_done: int = 0
+        self.scanned: int = 0
+        self.found: int = 0
+        self.errors: int = 0
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+    def progress(self) -> str:
+        """Describe how far the backfill has come.
+
+        Returns:
+            A one-line summary of the counters.
+        """
+
+        summary: str = (
+            f"{self.channels_done}/{self.channels} channels, "
+            f"{self.scanned} messages scanned, {self.found} mentions added"
+        )
+
+        if self.errors:
+            summary += f", {self.errors} failed"
+
+        return summary
+
+    def _readable_channels(self) -> list[discord.TextChannel]:
+        """List the text channels whose history the client can read.
+
+        Returns:
+            A list of TextChannel objects across every guild of the client.
+        """
+
+        channels: list[discord.TextChannel] = []
+
+        for guild in self.client.guilds:
+            for channel in guild.text_channels:
+                permissions: discord.Permissions = channel.permissions_for(
+                    guild.me
+                )
+
+                if (
+                        permissions.view_channel
+                        and permissions.read_message_history
+                ):
+                    channels.append(channel)
+
+        return channels
+
+    async def run(self) -> None:
+        """Scan every readable text channel from its checkpoint.
+
+        A channel that fails is logged and counted in errors; the other
+        channels are still scanned.
+
+        Returns:
+            None
+        """
+
+        async with get_async_session() as session:
+            checkpoints: dict[int, int] = await get_backfill_checkpoints(
+                session
+            )
+            window: tuple[int, int] | None = await get_untracked_window(
+                session
+            )
+
+        # Message ids bounding the history counted live without message ids.
+        untracked: tuple[int, int] | None = None
+
+        if window is not None:
+            start, end = (
+                datetime.fromtimestamp(ms / 1000, timezone.utc)
+                for ms in window
+            )
+            untracked = (
+                discord.utils.time_snowflake(start, high=False),
+                discord.utils.time_snowflake(end, high=True)
+            )
+
+        channels: list[discord.TextChannel] = self._readable_channels()
+        self.channels = len(channels)
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def scan(channel: discord.TextChannel) -> None:
+            async with semaphore:
+                try:
+                    await self._scan_channel(
+                        channel, checkpoints.get(channel.id), untracked
+                    )
+                except Exception as e:
+                    self.errors += 1
+                    self.logger.exception(
+                        "Error backfilling #%s: %s", channel.name, e
+                    )
+
+            self.channels_done += 1
+
+        await asyncio.gather(*(scan(channel) for channel in channels))
+        self.logger.info(f"Backfill finished: {self.progress()}")
+
+    async def _scan_channel(
+            self,
+            channel: discord.TextChannel,
+            checkpoint: int | None,
+            untracked: tuple[int, int] | None
+    ) -> None:
+        """Scan one channel's history after its checkpoint.
+
+        Messages between the untracked bounds are skipped, because mentions
+        in them were counted live before mentions recorded their message id
+        and cannot be deduplicated.
+
+        Args:
+            channel: The text channel to scan.
+            checkpoint: The id of the newest message scanned by an earlier
+                backfill, or None to scan from the first message.
+            untracked: The (first, last) message ids to skip, or None.
+
+        Returns:
+            None
+        """
+
+        # (after, before) message ids of each part of the history to scan.
+        ranges: list[tuple[int | None, int | None]] = [(checkpoint, None)]
+
+        if untracked is not None:
+            first, last = untracked
+            ranges = [(max(checkpoint or 0, last), None)]
+
+            if checkpoint is None or checkpoint < first:
+                ranges.insert(0, (checkpoint, first))
+
+        # Live mentions are rate limited as they arrive, so history is
+        # limited as of the time each message was sent.
+        sent_at: float = 0.0
+        limiter: MentionRateLimiter = MentionRateLimiter(
+            clock=lambda: sent_at
+        )
+
+        for after, before in ranges:
+            mentions: list[tuple[str, int, datetime]] = []
+            pending: int = 0
+            last_message_id: int | None = None
+
+            async for message in channel.history(
+                    limit=None,
+                    after=discord.Object(id=after) if after else None,
+                    before=discord.Object(id=before) if before else None,
+                    oldest_first=True
+            ):
+                pending += 1
+                last_message_id = message.id
+                sent_at = message.created_at.timestamp()
+
+                if (
+                        message.author != self.client.user
+                        and is_mention(message.content)
+                        and limiter.check(message.author.id, channel.id)
+                        is not Decision.IGNORE
+                ):
+                    mentions.append(
+                        (message.author.name, message.id, message.created_at)
+                    )
+
+                if pending >= self.batch_size:
+                    await self._write(
+                        channel, last_message_id, pending, mentions
+                    )
+                    mentions = []
+                    pending = 0
+
+            if pending:
+                await self._write(channel, last_message_id, pending, mentions)
+
+    async def _write(
+            self,
+            channel: discord.TextChannel,
+            last_message_id: int,
+            scanned: int,
+            mentions: list[tuple[str, int, datetime]]
+    ) -> None:
+        """Write a batch of mentions with the channel's checkpoint.
+
+        Args:
+            channel: The scanned text channel.
+            last_message_id: The id of the newest message scanned.
+            scanned: Number of messages scanned since the last write.
+            mentions: A list of (speaker_username, message_id, created_at)
+                tuples.
+
+        Returns:
+            None
+        """
+
+        async with get_async_session() as session:
+            found: int = await add_backfill_batch(
+                session, channel.id, last_message_id, scanned, mentions
+            )
+
+        self.scanned += scanned
+        self.found += found
@@ -0,0 +1,66 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+r"""Detect variations of "Sushi Masa" in message text.
+
+The original expression was two alternatives:
+
+    <sushi> [\s\S]* <masa>  |  <masa>
+
+where <masa> is m+[\s_-]*[a@4]+[\s_-]*[s$5z]+[\s_-]*[a@4]+. Every match of
+the first alternative contains a match of the second, so a message matches
+exactly when <masa> occurs somewhere in it. Only that part is kept, which
+drops the unbounded [\s\S]* that made long messages backtrack.
+
+The remaining pattern is made linear-time:
+    - Neighbouring character classes never overlap, so every quantifier can
+      be possessive without changing what matches.
+    - Only one trailing [a@4] is needed to decide that a match exists.
+    - (?<!m) starts matching only at the first "m" of a run. Any match that
+      starts later in the run also matches from its first "m".
+
+Every match starts with "m" or "M", so messages that contain neither are
+rejected by a substring check before the regex runs.
+"""
+
+import re
+
+
+PATTERN: re.Pattern = re.compile(
+    r"(?<!m)m++[\s_-]*+[a@4]++[\s_-]*+[s$5z]++[\s_-]*+[a@4]", re.I
+)
+
+
+def is_mention(content: str) -> bool:
+    """Check if a message mentions "Sushi Masa".
+
+    Args:
+        content: The text of the message.
+
+    Returns:
+        True if the message contains a variation of "Sushi Masa".
+    """
+
+    if "m" not in content and "M" not in content:
+        return False
+
+    return PATTERN.search(content) is not None
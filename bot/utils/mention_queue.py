@@ -0,0 +1,214 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Buffer detected mentions and write them to the database in batches.
+
+Writing every mention as it is detected costs a commit (and an fsync) per
+message. The MentionQueue collects mentions in memory and writes them in a
+single transaction once the buffer reaches the batch size or the flush interval
+has passed since the first buffered mention, whichever comes first.
+"""
+
+import asyncio
+import logging
+from typing import Callable
+
+from config import MENTION_BATCH_SIZE, MENTION_FLUSH_INTERVAL
+
+from db.async_crud import add_mentions
+from db.database import get_async_session
+
+
+# Longest wait between retries of a failed flush, in seconds.
+MAX_RETRY_DELAY: float = 60.0
+
+
+class MentionQueue:
+    """Write-behind queue of mentions waiting to be committed.
+
+    Attributes:
+        batch_size: Number of buffered mentions that triggers a flush.
+        flush_interval: Seconds a mention may wait before it is flushed.
+        on_flush: Called after every flush that wrote mentions.
+        logger: Logger object that logs events from this queue.
+    """
+
+    def __init__(
+            self,
+            batch_size: int = MENTION_BATCH_SIZE,
+            flush_interval: float = MENTION_FLUSH_INTERVAL,
+            on_flush: Callable[[], None] | None = None
+    ):
+        """Initialize an empty queue.
+
+        Args:
+            batch_size: Number of buffered mentions that triggers a flush.
+            flush_interval: Seconds a mention may wait before it is flushed.
+            on_flush: Called after every flush that wrote mentions.
+        """
+
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.on_flush: Callable[[], None] | None = on_flush
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+        self._buffer: list[tuple[str, int | None]] = []
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()
+        self._retry_delay: float = 0.0
+        self._closed: bool = False
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def put(self, username: str, message_id: int | None = None) -> None:
+        """Buffer a mention and schedule a flush.
+
+        Never waits on the database, so it is safe to call from event handlers.
+        After the queue is closed, mentions are still buffered and written by
+        the next call to flush or close.
+
+        Args:
+            username: The username of the Speaker attached to the mention.
+            message_id: The Discord id of the message the mention was detected
+                in, or of the interaction of the command that added it, so a
+                backfill of the channel does not count it again.
+
+        Returns:
+            None
+        """
+
+        self._buffer.append((username, message_id))
+
+        if self._closed:
+            return
+
+        if len(self._buffer) >= self.batch_size:
+            self._schedule(0)
+        elif self._flush_task is None:
+            self._schedule(self.flush_interval)
+
+    def _schedule(self, delay: float) -> None:
+        """Replace any pending flush with one that runs after delay seconds.
+
+        Args:
+            delay: Seconds to wait before flushing.
+
+        Returns:
+            None
+        """
+
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+
+        self._flush_task = asyncio.create_task(self._flush_after(delay))
+
+    async def _flush_after(self, delay: float) -> None:
+        """Sleep for delay seconds, then flush the buffer.
+
+        If the flush fails, another one is scheduled unless one is already
+        pending. The wait doubles with every consecutive failure, starting at
+        the flush interval, up to MAX_RETRY_DELAY.
+
+        Args:
+            delay: Seconds to wait before flushing.
+
+        Returns:
+            None
+        """
+
+        await asyncio.sleep(delay)
+
+        # Detach from _flush_task so a later _schedule cannot cancel the write.
+        task: asyncio.Task = asyncio.current_task()
+        self._flush_task = None
+        self._running.add(task)
+
+        try:
+            await self.flush()
+            self._retry_delay = 0.0
+        except Exception as e:
+            self._retry_delay = min(
+                max(self._retry_delay * 2, self.flush_interval),
+                MAX_RETRY_DELAY
+            )
+            self.logger.exception(
+                "Error flushing mentions, retrying in %ss: %s",
+                self._retry_delay, e
+            )
+
+            if not self._closed and self._flush_task is None:
+                self._schedule(self._retry_delay)
+        finally:
+            self._running.discard(task)
+
+    async def flush(self) -> int:
+        """Write every buffered mention in a single transaction.
+
+        If the write fails, the batch is put back at the front of the buffer so
+        it is retried by the next flush.
+
+        Returns:
+            The int number of mentions written.
+        """
+
+        async with self._lock:
+            if not self._buffer:
+                return 0
+
+            batch: list[tuple[str, int | None]] = self._buffer
+            self._buffer = []
+
+            try:
+                async with get_async_session() as session:
+                    usernames, message_ids = zip(*batch)
+                    await add_mentions(
+                        session, list(usernames), list(message_ids)
+                    )
+            except BaseException:
+                self._buffer[:0] = batch
+                raise
+
+        self.logger.info(f"Flushed {len(batch)} mention(s)")
+
+        if self.on_flush is not None:
+            self.on_flush()
+
+        return len(batch)
+
+    async def close(self) -> int:
+        """Stop scheduling flushes and write everything still buffered.
+
+        Safe to call more than once.
+
+        Returns:
+            The int number of mentions written.
+        """
+
+        self._closed = True
+
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        return await self.flush()
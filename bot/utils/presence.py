@@ -0,0 +1,148 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Show the Sushi Masa Meter as the bot's Discord presence.
+
+The presence changes only when the meter does. The bot notifies the
+PresenceUpdater after writing mentions, and bursts of notifications within
+the debounce window become a single update. Every update first reads the
+data version (see db.crud.get_data_version) and stops there if nothing has
+changed. When the meter is read but equals the value already shown, no
+presence update is sent to the gateway. A slow periodic update catches
+changes made by other processes.
+"""
+
+import asyncio
+import logging
+
+import discord
+
+from config import PRESENCE_DEBOUNCE
+
+from db.async_crud import get_data_version, get_meter
+from db.database import get_async_session
+
+
+class PresenceUpdater:
+    """Keep a client's presence in sync with the Sushi Masa Meter.
+
+    Attributes:
+        client: The Discord client whose presence is updated.
+        debounce: Seconds to wait after a notification before updating.
+        updates: Number of presence updates sent to the gateway.
+        logger: Logger object that logs events from this updater.
+    """
+
+    def __init__(
+            self, client: discord.Client, debounce: float = PRESENCE_DEBOUNCE
+    ):
+        """Initialize an updater that has not shown the meter yet.
+
+        Args:
+            client: The Discord client whose presence is updated.
+            debounce: Seconds to wait after a notification before updating.
+        """
+
+        self.client: discord.Client = client
+        self.debounce: float = debounce
+        self.updates: int = 0
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+        self._meter: int | None = None
+        self._version: int | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    def notify(self) -> None:
+        """Schedule an update after the debounce window.
+
+        Notifications that arrive while an update is pending share it.
+
+        Returns:
+            None
+        """
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._update_after(self.debounce))
+
+    async def _update_after(self, delay: float) -> None:
+        """Sleep for delay seconds, then update the presence.
+
+        Args:
+            delay: Seconds to wait before updating.
+
+        Returns:
+            None
+        """
+
+        await asyncio.sleep(delay)
+        self._task = None
+
+        try:
+            await self.update()
+        except Exception as e:
+            self.logger.exception("Error updating presence: %s", e)
+
+    async def update(self, force: bool = False) -> bool:
+        """Show the current meter if it changed since the last update.
+
+        Args:
+            force: Send the presence even if nothing changed, e.g. after the
+                client reconnected.
+
+        Returns:
+            True if a presence update was sent.
+        """
+
+        async with self._lock:
+            async with get_async_session() as session:
+                version: int = await get_data_version(session)
+
+                if not force and version == self._version:
+                    return False
+
+                meter: int = await get_meter(session)
+
+            self._version = version
+
+            if not force and meter == self._meter:
+                return False
+
+            await self.client.change_presence(activity=discord.Activity(
+                type=discord.ActivityType.watching,
+                name=f"Sushi Masa Meter: {meter}"
+            ))
+            self._meter = meter
+            self.updates += 1
+
+        return True
+
+    def close(self) -> None:
+        """Cancel a pending update.
+
+        Returns:
+            None
+        """
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,195 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Rate limit mention ingestion per author and per channel.
+
+Every detected mention takes a token from its author's bucket and, for the
+confirmation reply, one from its channel's bucket. Buckets refill at a steady
+rate up to their burst size, so normal conversation is never limited while a
+spam wave quickly runs dry:
+
+    COUNT: Both buckets had a token. Record the mention and reply.
+    MERGE: The channel ran out. Record the mention without replying; the
+        replies already sent in the channel stand for it.
+    IGNORE: The author ran out. Neither record nor reply.
+
+The decision is made in memory before any database or Discord API work.
+"""
+
+from enum import Enum
+import time
+from typing import Callable, Hashable
+
+from config import (
+    MENTION_CHANNEL_BURST, MENTION_CHANNEL_RATE, MENTION_USER_BURST,
+    MENTION_USER_RATE
+)
+
+
+class Decision(Enum):
+    """Enumeration for what to do with a detected mention."""
+
+    COUNT = "count"
+    MERGE = "merge"
+    IGNORE = "ignore"
+
+
+class TokenBuckets:
+    """Token buckets that share a burst size and refill rate, one per key.
+
+    Keys whose bucket has refilled completely are forgotten once more than
+    max_keys buckets exist, which is the same as starting them over.
+
+    Attributes:
+        burst: Number of tokens a full bucket holds.
+        rate: Tokens added to every bucket per second.
+        max_keys: Number of buckets kept before full ones are pruned.
+    """
+
+    def __init__(
+            self,
+            burst: float,
+            rate: float,
+            max_keys: int = 10000,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize with every bucket full.
+
+        Args:
+            burst: Number of tokens a full bucket holds.
+            rate: Tokens added to every bucket per second.
+            max_keys: Number of buckets kept before full ones are pruned.
+            clock: Returns the current time in seconds.
+        """
+
+        self.burst: float = burst
+        self.rate: float = rate
+        self.max_keys: int = max_keys
+
+        self._clock: Callable[[], float] = clock
+        # key -> (tokens, time of last refill)
+        self._buckets: dict[Hashable, tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def peek(self, key: Hashable) -> float:
+        """Count the tokens in a bucket without taking any.
+
+        Args:
+            key: The key of the bucket.
+
+        Returns:
+            The number of tokens available.
+        """
+
+        now: float = self._clock()
+        tokens, updated = self._buckets.get(key, (self.burst, now))
+
+        return min(self.burst, tokens + (now - updated) * self.rate)
+
+    def take(self, key: Hashable) -> bool:
+        """Take a token from a bucket if it has one.
+
+        Args:
+            key: The key of the bucket.
+
+        Returns:
+            True if a token was taken.
+        """
+
+        tokens: float = self.peek(key)
+
+        if tokens < 1:
+            return False
+
+        if len(self._buckets) >= self.max_keys and key not in self._buckets:
+            self._prune()
+
+        self._buckets[key] = (tokens - 1, self._clock())
+
+        return True
+
+    def _prune(self) -> None:
+        """Forget every bucket that has refilled completely.
+
+        Returns:
+            None
+        """
+
+        self._buckets = {
+            key: bucket for key, bucket in self._buckets.items()
+            if self.peek(key) < self.burst
+        }
+
+
+class MentionRateLimiter:
+    """Decide whether a detected mention is counted and replied to.
+
+    Attributes:
+        authors: Token buckets keyed by author id.
+        channels: Token buckets keyed by channel id.
+    """
+
+    def __init__(
+            self,
+            user_burst: float = MENTION_USER_BURST,
+            user_rate: float = MENTION_USER_RATE,
+            channel_burst: float = MENTION_CHANNEL_BURST,
+            channel_rate: float = MENTION_CHANNEL_RATE,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize with every bucket full.
+
+        Args:
+            user_burst: Mentions an author can make in a row.
+            user_rate: Mentions per second an author regains.
+            channel_burst: Replies a channel can get in a row.
+            channel_rate: Replies per second a channel regains.
+            clock: Returns the current time in seconds.
+        """
+
+        self.authors: TokenBuckets = TokenBuckets(
+            user_burst, user_rate, clock=clock
+        )
+        self.channels: TokenBuckets = TokenBuckets(
+            channel_burst, channel_rate, clock=clock
+        )
+
+    def check(self, author_id: int, channel_id: int) -> Decision:
+        """Decide what to do with a mention and take the tokens it uses.
+
+        Args:
+            author_id: The Discord id of the message author.
+            channel_id: The Discord id of the channel.
+
+        Returns:
+            The Decision for the mention.
+        """
+
+        if not self.authors.take(author_id):
+            return Decision.IGNORE
+
+        if not self.channels.take(channel_id):
+            return Decision.MERGE
+
+        return Decision.COUNT
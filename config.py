@@ -41,6 +41,12 @@ load_dotenv(BASE_DIR / ".env")
 
 # Database
 DATABASE_PATH = DATA_DIR / "masa_meter.db"
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "5"))
+DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "10"))
+DATABASE_POOL_TIMEOUT = float(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
+DATABASE_BUSY_TIMEOUT_MS = int(os.getenv("DATABASE_BUSY_TIMEOUT_MS", "5000"))
+DATABASE_CACHE_SIZE_KIB = int(os.getenv("DATABASE_CACHE_SIZE_KIB", "16384"))
+DATABASE_MMAP_SIZE = int(os.getenv("DATABASE_MMAP_SIZE", str(64 * 1024**2)))
 
 # Discord Bot
 DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
@@ -48,6 +54,22 @@ TEST_BOT_TOKEN = os.getenv("TEST_BOT_TOKEN")        # For testing purposes
 MAIN_GUILD_ID = int(os.getenv("MAIN_GUILD_ID"))
 DEV_GUILD_ID = int(os.getenv("DEV_GUILD_ID"))
 
+MENTION_BATCH_SIZE = int(os.getenv("MENTION_BATCH_SIZE", "50"))
+MENTION_FLUSH_INTERVAL = float(os.getenv("MENTION_FLUSH_INTERVAL", "0.25"))
+MENTION_USER_BURST = float(os.getenv("MENTION_USER_BURST", "3"))
+MENTION_USER_RATE = float(os.getenv("MENTION_USER_RATE", "0.2"))
+MENTION_CHANNEL_BURST = float(os.getenv("MENTION_CHANNEL_BURST", "5"))
+MENTION_CHANNEL_RATE = float(os.getenv("MENTION_CHANNEL_RATE", "0.2"))
+PRESENCE_DEBOUNCE = float(os.getenv("PRESENCE_DEBOUNCE", "2"))
+PRESENCE_RECONCILE_INTERVAL = float(
+    os.getenv("PRESENCE_RECONCILE_INTERVAL", "60")
+)
+BACKFILL_CONCURRENCY = int(os.getenv("BACKFILL_CONCURRENCY", "4"))
+BACKFILL_BATCH_SIZE = int(os.getenv("BACKFILL_BATCH_SIZE", "500"))
+BACKFILL_PROGRESS_INTERVAL = float(
+    os.getenv("BACKFILL_PROGRESS_INTERVAL", "5")
+)
+
 BOT_DIR = BASE_DIR / "bot"
 COGS_DIR = BOT_DIR / "cogs"
 ASSETS_DIR = BOT_DIR / "assets"
@@ -59,6 +81,29 @@ DISCORD_LOG_PATH = DATA_DIR / "discord.log"
 JOIN_MP3_PATH = AUDIO_DIR / "join.mp3"
 LEAVE_MP3_PATH = AUDIO_DIR / "leave.mp3"
 
+# API
+API_HOST = os.getenv("API_HOST", "0.0.0.0")
+API_PORT = int(os.getenv("API_PORT", "8000"))
+# Each worker process runs its own change watcher and photo pool.
+API_WORKERS = int(os.getenv("API_WORKERS", "1"))
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", "40"))
+# Seconds to wait for open requests (event streams) before cancelling them.
+API_SHUTDOWN_TIMEOUT = int(os.getenv("API_SHUTDOWN_TIMEOUT", "3"))
+API_GZIP_MINIMUM_SIZE = int(os.getenv("API_GZIP_MINIMUM_SIZE", "1024"))
+API_GZIP_LEVEL = int(os.getenv("API_GZIP_LEVEL", "6"))
+EVENTS_POLL_INTERVAL = float(os.getenv("EVENTS_POLL_INTERVAL", "1"))
+EVENTS_KEEPALIVE_INTERVAL = float(os.getenv("EVENTS_KEEPALIVE_INTERVAL", "15"))
+EVENTS_QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", "64"))
+IMAGE_CACHE_DIR = DATA_DIR / "images"
+IMAGE_CACHE_MAX_BYTES = int(
+    os.getenv("IMAGE_CACHE_MAX_BYTES", str(64 * 1024**2))
+)
+
 # Frontend
 PEXELS_API_KEY = os.getenv("PEXELS_API_KEY")
-PEXELS_URL = "https://api.pexels.com/v1/search"
\ No newline at end of file
+PEXELS_URL = os.getenv("PEXELS_URL", "https://api.pexels.com/v1/search")
+PEXELS_QUERY = os.getenv("PEXELS_QUERY", "sushi art")
+PEXELS_PER_PAGE = int(os.getenv("PEXELS_PER_PAGE", "50"))
+PEXELS_TIMEOUT = float(os.getenv("PEXELS_TIMEOUT", "10"))
+PEXELS_REFRESH_INTERVAL = float(os.getenv("PEXELS_REFRESH_INTERVAL", "3600"))
+PEXELS_RETRY_INTERVAL = float(os.getenv("PEXELS_RETRY_INTERVAL", "60"))
\ No newline at end of file
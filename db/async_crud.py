@@ -0,0 +1,329 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provide asyncio versions of the database operations in db.crud.
+
+Each function runs its db.crud counterpart through AsyncSession.run_sync, so
+the queries stay defined in one place while the SQLite I/O happens on the
+aiosqlite worker thread instead of the event loop. Query results are fetched in
+full before returning so callers can iterate them outside the session.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db import crud
+from db.models import MasaMention, Speaker
+
+
+async def check_speaker(session: AsyncSession, username: str) -> Speaker | None:
+    """Check if speaker's username exists in the database.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+        username: The username to be query.
+
+    Returns:
+        The Speaker object if it exits; otherwise returns None.
+    """
+
+    return await session.run_sync(crud.check_speaker, username)
+
+
+async def create_speaker(session: AsyncSession, username: str) -> Speaker:
+    """Create a new Speaker entry in the database.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+        username: The username of the new Speaker entry.
+
+    Returns:
+        The newly created Speaker object or an existing Speaker object if the
+        username already exits.
+    """
+
+    return await session.run_sync(crud.create_speaker, username)
+
+
+async def delete_speaker(
+        session: AsyncSession, username: str
+) -> Speaker | None:
+    """Delete Speaker from the database.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+        username: The username of the Speaker to be deleted.
+
+    Returns:
+        The Speaker object that was deleted if it exits; otherwise None
+    """
+
+    return await session.run_sync(crud.delete_speaker, username)
+
+
+async def create_mention(session: AsyncSession, username: str) -> MasaMention:
+    """Create a MasaMention entry in the database.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+        username: The username of the Speaker attached to the mention.
+
+    Returns:
+        The newly created MasaMention object.
+    """
+
+    return await session.run_sync(crud.create_mention, username)
+
+
+async def add_mention(session: AsyncSession, username: str) -> str:
+    """Create a MasaMention entry with a single commit.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+        username: The username of the Speaker attached to the mention.
+
+    Returns:
+        The id of the newly created MasaMention.
+    """
+
+    return await session.run_sync(crud.add_mention, username)
+
+
+async def add_mentions(
+        session: AsyncSession,
+        usernames: list[str],
+        message_ids: list[int | None] | None = None
+) -> list[str]:
+    """Create a batch of MasaMention entries with a single commit.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+        usernames: The username of the Speaker attached to each mention.
+        message_ids: The Discord message id of each mention, or None for
+            mentions without a message. Mentions of a message that is already
+            recorded are skipped.
+
+    Returns:
+        The ids of the newly created MasaMention entries in the same order as
+        usernames, leaving out skipped mentions.
+    """
+
+    return await session.run_sync(crud.add_mentions, usernames, message_ids)
+
+
+async def add_backfill_batch(
+        session: AsyncSession,
+        channel_id: int,
+        last_message_id: int,
+        scanned: int,
+        mentions: list[tuple[str, int, datetime]]
+) -> int:
+    """Record mentions found in a channel's history with its checkpoint.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+        channel_id: The Discord id of the scanned channel.
+        last_message_id: The Discord id of the newest message scanned.
+        scanned: Number of messages scanned since the previous checkpoint.
+        mentions: A list of (speaker_username, message_id, created_at)
+            tuples.
+
+    Returns:
+        The int number of MasaMention entries created.
+    """
+
+    return await session.run_sync(
+        crud.add_backfill_batch, channel_id, last_message_id, scanned, mentions
+    )
+
+
+async def get_backfill_checkpoints(session: AsyncSession) -> dict[int, int]:
+    """Retrieve how far each channel has been backfilled.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+
+    Returns:
+        A dictionary mapping channel ids to the id of the newest message
+        scanned in the channel.
+    """
+
+    return await session.run_sync(crud.get_backfill_checkpoints)
+
+
+async def get_untracked_window(
+        session: AsyncSession
+) -> tuple[int, int] | None:
+    """Find the period whose mentions were counted without a message id.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+
+    Returns:
+        A tuple in the form (start, end) of epoch milliseconds, or None if
+        there is no such period.
+    """
+
+    return await session.run_sync(crud.get_untracked_window)
+
+
+async def delete_mention(
+        session: AsyncSession, mention_id: str
+) -> MasaMention | None:
+    """Delete MasaMention from the database.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+        mention_id: The id of the MasaMention to be deleted.
+
+    Returns:
+        The MasaMention object that was deleted if it exits; otherwise None
+    """
+
+    return await session.run_sync(crud.delete_mention, mention_id)
+
+
+async def get_meter(session: AsyncSession) -> int:
+    """Fetch the number of MasaMention entries in the database.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+
+    Returns:
+        The int count of the Masa meter.
+    """
+
+    return await session.run_sync(crud.get_meter)
+
+
+async def get_data_version(session: AsyncSession) -> int:
+    """Fetch the data version of the masa_mentions table.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+
+    Returns:
+        The int data version, or 0 if the meter_state row has not been seeded.
+    """
+
+    return await session.run_sync(crud.get_data_version)
+
+
+async def get_history(session: AsyncSession) -> list[Row]:
+    """Retrieve all records in the MasaMention table.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+
+    Returns:
+        A list of rows in the form (date, speaker_username).
+    """
+
+    return await session.run_sync(lambda s: crud.get_history(s).all())
+
+
+async def get_history_page(
+        session: AsyncSession,
+        limit: int,
+        cursor: tuple[int, str] | None = None,
+        before: int | None = None,
+        after: int | None = None,
+        speaker: str | None = None
+) -> list[Row]:
+    """Retrieve one page of MasaMention entries, newest first.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+        limit: The maximum number of entries in the page.
+        cursor: The (ts, id) of the last entry of the previous page.
+        before: Only return entries with ts lower than this epoch millisecond.
+        after: Only return entries with ts at or above this epoch millisecond.
+        speaker: Only return entries attached to this Speaker's username.
+
+    Returns:
+        A list of at most limit rows in the form:
+            (ts, id, date, speaker_username)
+    """
+
+    return await session.run_sync(
+        crud.get_history_page, limit, cursor, before, after, speaker
+    )
+
+
+async def get_series(
+        session: AsyncSession,
+        bucket: str,
+        start: int | None = None,
+        end: int | None = None,
+        speaker: str | None = None
+) -> list[Row]:
+    """Count MasaMention entries per time bucket.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+        bucket: One of db.crud.SERIES_BUCKETS.
+        start: Only count entries with ts at or above this epoch millisecond.
+        end: Only count entries with ts lower than this epoch millisecond.
+        speaker: Only count entries attached to this Speaker's username.
+
+    Returns:
+        A list of rows in the form (bucket_start, count), ordered by
+        bucket_start (epoch milliseconds).
+    """
+
+    return await session.run_sync(
+        crud.get_series, bucket, start, end, speaker
+    )
+
+
+async def get_leaderboard(
+        session: AsyncSession, limit: int | None = None
+) -> list[Row]:
+    """Retrieve the Speaker's with the most entries in the MasaMention table.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+        limit: If given, only the top limit speakers are returned.
+
+    Returns:
+        A list of rows ordered from most to fewest MasaMention entries in the
+        form (speaker_username, count).
+    """
+
+    return await session.run_sync(
+        lambda s: crud.get_leaderboard(s, limit).all()
+    )
+
+
+async def get_achievements(session: AsyncSession) -> list[str]:
+    """Retrieve the username that holds each achievement.
+
+    Args:
+        session: A SQLAlchemy asyncio session with the database.
+
+    Returns:
+        A list of usernames ordered as in db.crud.get_achievements.
+    """
+
+    return await session.run_sync(crud.get_achievements)
@@ -0,0 +1,122 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Cache values derived from the database until the data changes.
+
+A VersionedCache memoizes the result of a computation together with the data
+version it was computed at (see db.crud.get_data_version). Every lookup costs
+one primary key read of the version; the computation only runs again after a
+mention has been inserted or deleted, or after anything else the computation
+depends on, such as the current date, has changed.
+"""
+
+import threading
+from typing import Callable, Generic, Hashable, TypeVar
+
+from sqlalchemy.orm import Session
+
+from db.crud import get_data_version
+
+
+T = TypeVar("T")
+
+
+class VersionedCache(Generic[T]):
+    """Memoize a database computation keyed on the data version.
+
+    Safe to share between threads.
+
+    Attributes:
+        compute: The function that derives the cached value from a session.
+        key: Returns what compute depends on besides the data, or None if
+            it only depends on the data.
+        hits: Number of lookups served from memory.
+        misses: Number of lookups that ran compute.
+    """
+
+    def __init__(
+            self,
+            compute: Callable[[Session], T],
+            key: Callable[[], Hashable] | None = None
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            compute: The function that derives the cached value from a session.
+            key: Returns what compute depends on besides the data. The value
+                is recomputed when it changes.
+        """
+
+        self.compute: Callable[[Session], T] = compute
+        self.key: Callable[[], Hashable] | None = key
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._lock: threading.Lock = threading.Lock()
+        self._version: int | None = None
+        self._key: Hashable = None
+        self._value: T | None = None
+
+    def get(self, session: Session) -> T:
+        """Return the cached value, recomputing it if the data has changed.
+
+        The version is read before computing, so a write that lands during the
+        computation only causes one extra recomputation on the next lookup.
+
+        Args:
+            session: A SQLAlchemy session with the database.
+
+        Returns:
+            The value computed at the current data version and key.
+        """
+
+        version: int = get_data_version(session)
+        key: Hashable = self.key() if self.key is not None else None
+
+        with self._lock:
+            if version == self._version and key == self._key:
+                self.hits += 1
+                return self._value
+
+            self.misses += 1
+
+        value: T = self.compute(session)
+
+        with self._lock:
+            if self._version is None or version >= self._version:
+                self._version, self._key, self._value = version, key, value
+
+        return value
+
+    def stats(self) -> dict:
+        """Report the hit and miss counters.
+
+        Returns:
+            A dictionary containing hits, misses, and the cached version.
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "version": self._version
+            }
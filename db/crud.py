@@ -26,15 +26,32 @@ Define functions to manage Speakers and MasaMention entries in the database.
 This includes creating, deleting, and querying speakers, incrementing the
 Masa meter, retrieving meter counts, fetching history, and generating a
 leaderboard.
+
+The meter, the per-speaker totals, and the per-speaker daily counts are
+materialized in the meter_state, speaker_stats, and daily_counts tables. Every
+function that inserts or deletes a MasaMention also updates those tables inside
+the same transaction, so reading the meter, the leaderboard, or the day-based
+achievements never has to aggregate the masa_mentions table.
 """
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Tuple
+import uuid
 
-from sqlalchemy import Select, Subquery, Result, func, select
+from sqlalchemy import (
+    ColumnElement, Integer, Row, Select, Result, Update, and_, cast, delete,
+    func, insert, or_, select, tuple_, update
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
-from db.models import Speaker, MasaMention
+from db.models import (
+    METER_STATE_ID, MS_PER_DAY, MS_PER_HOUR, BackfillCheckpoint, DailyCount,
+    MasaMention, MeterState, Speaker, SpeakerStats, to_epoch_ms
+)
+
+
+SERIES_BUCKETS: tuple[str, ...] = ("hour", "day", "week", "month")
 
 
 def check_speaker(session: Session, username: str) -> Speaker | None:
@@ -118,12 +135,270 @@ def create_mention(session: Session, username: str) -> MasaMention:
     mention: MasaMention = MasaMention(speaker=speaker)
 
     session.add(mention)
+    session.flush()
+    _record_mentions(session, [(username, mention.ts)])
     session.commit()
     session.refresh(mention)
 
     return mention
 
 
+def add_mention(session: Session, username: str) -> str:
+    """Create a MasaMention entry with a single commit.
+
+    Fast path for create_mention. The speaker is upserted with INSERT OR
+    IGNORE and the mention is inserted with a Core statement, so no ORM
+    objects are loaded or refreshed and the transaction is committed once.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        username: The username of the Speaker attached to the mention.
+
+    Returns:
+        The id of the newly created MasaMention.
+    """
+
+    return add_mentions(session, [username])[0]
+
+
+def _insert_mentions(session: Session, rows: list[dict]) -> list[str]:
+    """Insert MasaMention rows and update the materialized tables.
+
+    Speakers are upserted with one INSERT OR IGNORE and the mentions are
+    inserted with one executemany. Rows whose message_id is already recorded
+    are skipped. Does not commit.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        rows: The masa_mentions rows, each containing id, date, ts,
+            speaker_username, and message_id.
+
+    Returns:
+        The ids of the inserted rows.
+    """
+
+    if not rows:
+        return []
+
+    session.execute(
+        sqlite_insert(Speaker).on_conflict_do_nothing(),
+        [
+            {"username": username}
+            for username in dict.fromkeys(
+                row["speaker_username"] for row in rows
+            )
+        ]
+    )
+
+    stmt = (
+        sqlite_insert(MasaMention)
+        .on_conflict_do_nothing(index_elements=[MasaMention.message_id])
+        .returning(
+            MasaMention.id, MasaMention.speaker_username, MasaMention.ts
+        )
+    )
+    inserted: list[Row] = session.execute(stmt, rows).all()
+
+    if inserted:
+        _record_mentions(
+            session, [(username, ts) for _, username, ts in inserted]
+        )
+
+    return [mention_id for mention_id, _, _ in inserted]
+
+
+def add_mentions(
+        session: Session,
+        usernames: list[str],
+        message_ids: list[int | None] | None = None
+) -> list[str]:
+    """Create a batch of MasaMention entries with a single commit.
+
+    Speakers are upserted with one INSERT OR IGNORE and the mentions are
+    inserted with one executemany, then the meter is updated and the batch is
+    committed.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        usernames: The username of the Speaker attached to each mention.
+        message_ids: The Discord message id of each mention, or None for
+            mentions without a message. Mentions of a message that is already
+            recorded are skipped.
+
+    Returns:
+        The ids of the newly created MasaMention entries in the same order as
+        usernames, leaving out skipped mentions.
+    """
+
+    if not usernames:
+        return []
+
+    if message_ids is None:
+        message_ids = [None] * len(usernames)
+
+    now: datetime = datetime.now(timezone.utc)
+    rows: list[dict] = [
+        {
+            "id": str(uuid.uuid4()),
+            "date": now.isoformat(),
+            "ts": to_epoch_ms(now),
+            "speaker_username": username,
+            "message_id": message_id
+        }
+        for username, message_id in zip(usernames, message_ids)
+    ]
+
+    inserted: set[str] = set(_insert_mentions(session, rows))
+    session.commit()
+
+    return [row["id"] for row in rows if row["id"] in inserted]
+
+
+def add_backfill_batch(
+        session: Session,
+        channel_id: int,
+        last_message_id: int,
+        scanned: int,
+        mentions: list[Tuple[str, int, datetime]]
+) -> int:
+    """Record mentions found in a channel's history with its checkpoint.
+
+    The mentions and the checkpoint are committed together, so a backfill
+    resumed from the checkpoint neither misses nor repeats a mention.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        channel_id: The Discord id of the scanned channel.
+        last_message_id: The Discord id of the newest message scanned.
+        scanned: Number of messages scanned since the previous checkpoint.
+        mentions: A list of (speaker_username, message_id, created_at)
+            tuples. Messages that are already recorded are skipped.
+
+    Returns:
+        The int number of MasaMention entries created.
+    """
+
+    rows: list[dict] = [
+        {
+            "id": str(uuid.uuid4()),
+            "date": created_at.isoformat(),
+            "ts": to_epoch_ms(created_at),
+            "speaker_username": username,
+            "message_id": message_id
+        }
+        for username, message_id, created_at in mentions
+    ]
+
+    found: int = len(_insert_mentions(session, rows))
+
+    stmt = sqlite_insert(BackfillCheckpoint).values(
+        channel_id=channel_id,
+        last_message_id=last_message_id,
+        scanned=scanned,
+        found=found
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[BackfillCheckpoint.channel_id],
+        set_={
+            "last_message_id": stmt.excluded.last_message_id,
+            "scanned": BackfillCheckpoint.scanned + stmt.excluded.scanned,
+            "found": BackfillCheckpoint.found + stmt.excluded.found
+        }
+    )
+
+    session.execute(stmt)
+    session.commit()
+
+    return found
+
+
+def get_backfill_checkpoints(session: Session) -> dict[int, int]:
+    """Retrieve how far each channel has been backfilled.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+
+    Returns:
+        A dictionary mapping channel ids to the id of the newest message
+        scanned in the channel.
+    """
+
+    results: Result = session.execute(
+        select(
+            BackfillCheckpoint.channel_id, BackfillCheckpoint.last_message_id
+        )
+    )
+
+    return dict(results.all())
+
+
+def seed_message_ids_since(session: Session) -> int | None:
+    """Record when mentions started recording their message id.
+
+    Mentions detected before have no message id, so a backfill cannot tell
+    which messages they were counted from. Only db.migrate calls this, right
+    after adding the message_id column, so every existing mention is such a
+    mention. Mentions added by command afterwards carry their interaction id.
+    The time is only recorded once, and only if mentions exist.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+
+    Returns:
+        The recorded epoch millisecond, or None if every mention has a
+        message id or the meter_state row has not been seeded.
+    """
+
+    state: MeterState | None = session.get(MeterState, METER_STATE_ID)
+
+    if state is None or state.message_ids_since is not None:
+        return state.message_ids_since if state is not None else None
+
+    untracked: int | None = session.scalar(
+        select(func.min(MasaMention.ts))
+        .where(MasaMention.message_id.is_(None))
+    )
+
+    if untracked is None:
+        return None
+
+    state.message_ids_since = to_epoch_ms(datetime.now(timezone.utc))
+    session.commit()
+
+    return state.message_ids_since
+
+
+def get_untracked_window(session: Session) -> Tuple[int, int] | None:
+    """Find the period whose mentions were counted without a message id.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+
+    Returns:
+        A tuple in the form (start, end) of epoch milliseconds, from the
+        first mention without a message id to the time mentions started
+        recording one, or None if there is no such period.
+    """
+
+    since: int | None = session.scalar(
+        select(MeterState.message_ids_since)
+        .where(MeterState.id == METER_STATE_ID)
+    )
+
+    if since is None:
+        return None
+
+    start: int | None = session.scalar(
+        select(func.min(MasaMention.ts))
+        .where(MasaMention.message_id.is_(None), MasaMention.ts < since)
+    )
+
+    if start is None:
+        return None
+
+    return start, since
+
+
 def delete_mention(session: Session, mention_id: str) -> MasaMention | None:
     """Delete MasaMention from the database.
 
@@ -139,14 +414,236 @@ def delete_mention(session: Session, mention_id: str) -> MasaMention | None:
 
     if mention:
         session.delete(mention)
+        session.flush()
+        _forget_mention(session, mention.speaker_username, mention.ts)
         session.commit()
 
     return mention
 
 
+def _count_mentions(session: Session) -> int:
+    """Count the MasaMention entries in the database.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+
+    Returns:
+        The int number of rows in the masa_mentions table.
+    """
+
+    stmt: Select = select(func.count(MasaMention.id))
+
+    return session.scalar(stmt)
+
+
+def _update_meter(session: Session, delta: int) -> None:
+    """Adjust the materialized meter inside the caller's transaction.
+
+    Also bumps the data version. Seeds the meter_state row from the
+    masa_mentions table if it does not exist yet. Pending mention changes must
+    be flushed before calling this function.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        delta: The number of mentions added (positive) or removed (negative).
+
+    Returns:
+        None
+    """
+
+    stmt: Update = (
+        update(MeterState)
+        .where(MeterState.id == METER_STATE_ID)
+        .values(
+            count=MeterState.count + delta, version=MeterState.version + 1
+        )
+    )
+
+    if session.execute(stmt).rowcount == 0:
+        session.add(MeterState(
+            id=METER_STATE_ID, count=_count_mentions(session), version=1
+        ))
+
+
+def _add_speaker_stats(
+        session: Session, mentions: list[Tuple[str, int]]
+) -> None:
+    """Add newly inserted mentions to the speaker_stats table.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        mentions: A list of (speaker_username, ts) tuples.
+
+    Returns:
+        None
+    """
+
+    totals: dict[str, dict] = {}
+
+    for username, ts in mentions:
+        row: dict | None = totals.get(username)
+
+        if row is None:
+            totals[username] = {
+                "username": username, "total": 1, "first_ts": ts, "last_ts": ts
+            }
+        else:
+            row["total"] += 1
+            row["first_ts"] = min(row["first_ts"], ts)
+            row["last_ts"] = max(row["last_ts"], ts)
+
+    stmt = sqlite_insert(SpeakerStats)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SpeakerStats.username],
+        set_={
+            "total": SpeakerStats.total + stmt.excluded.total,
+            "first_ts": func.min(SpeakerStats.first_ts, stmt.excluded.first_ts),
+            "last_ts": func.max(SpeakerStats.last_ts, stmt.excluded.last_ts)
+        }
+    )
+
+    session.execute(stmt, list(totals.values()))
+
+
+def _remove_speaker_stats(session: Session, username: str) -> None:
+    """Remove a deleted mention from the speaker_stats table.
+
+    The first and last timestamps are recomputed through the
+    (speaker_username, ts) index. The row is deleted once the speaker has no
+    mentions left. The mention must already be deleted and flushed.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        username: The username of the Speaker attached to the mention.
+
+    Returns:
+        None
+    """
+
+    speaker_ts: Select = select(MasaMention.ts).where(
+        MasaMention.speaker_username == username
+    )
+
+    session.execute(
+        update(SpeakerStats)
+        .where(SpeakerStats.username == username)
+        .values(
+            total=SpeakerStats.total - 1,
+            first_ts=speaker_ts.order_by(MasaMention.ts.asc())
+            .limit(1).scalar_subquery(),
+            last_ts=speaker_ts.order_by(MasaMention.ts.desc())
+            .limit(1).scalar_subquery()
+        )
+    )
+    session.execute(
+        delete(SpeakerStats)
+        .where(
+            (SpeakerStats.username == username) & (SpeakerStats.total <= 0)
+        )
+    )
+
+
+def _add_daily_counts(
+        session: Session, mentions: list[Tuple[str, int]]
+) -> None:
+    """Add newly inserted mentions to the daily_counts table.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        mentions: A list of (speaker_username, ts) tuples.
+
+    Returns:
+        None
+    """
+
+    counts: dict[Tuple[int, str], int] = {}
+
+    for username, ts in mentions:
+        key: Tuple[int, str] = (ts // MS_PER_DAY, username)
+        counts[key] = counts.get(key, 0) + 1
+
+    stmt = sqlite_insert(DailyCount)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DailyCount.day, DailyCount.speaker_username],
+        set_={"count": DailyCount.count + stmt.excluded.count}
+    )
+
+    session.execute(stmt, [
+        {"day": day, "speaker_username": username, "count": count}
+        for (day, username), count in counts.items()
+    ])
+
+
+def _remove_daily_count(session: Session, username: str, ts: int) -> None:
+    """Remove a deleted mention from the daily_counts table.
+
+    The row is deleted once the speaker has no mentions left on that day.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        username: The username of the Speaker attached to the mention.
+        ts: The epoch milliseconds of the mention.
+
+    Returns:
+        None
+    """
+
+    key = (
+        (DailyCount.day == ts // MS_PER_DAY) &
+        (DailyCount.speaker_username == username)
+    )
+
+    session.execute(
+        update(DailyCount).where(key).values(count=DailyCount.count - 1)
+    )
+    session.execute(delete(DailyCount).where(key & (DailyCount.count <= 0)))
+
+
+def _record_mentions(
+        session: Session, mentions: list[Tuple[str, int]]
+) -> None:
+    """Update the materialized tables for newly inserted mentions.
+
+    The mentions must already be flushed.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        mentions: A list of (speaker_username, ts) tuples.
+
+    Returns:
+        None
+    """
+
+    _update_meter(session, len(mentions))
+    _add_speaker_stats(session, mentions)
+    _add_daily_counts(session, mentions)
+
+
+def _forget_mention(session: Session, username: str, ts: int) -> None:
+    """Update the materialized tables for a deleted mention.
+
+    The deletion must already be flushed.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        username: The username of the Speaker attached to the mention.
+        ts: The epoch milliseconds of the mention.
+
+    Returns:
+        None
+    """
+
+    _update_meter(session, -1)
+    _remove_speaker_stats(session, username)
+    _remove_daily_count(session, username, ts)
+
+
 def get_meter(session: Session) -> int:
     """Fetch the number of MasaMention entries in the database.
 
+    Reads the materialized meter_state row. Falls back to counting the
+    masa_mentions table if the row has not been seeded yet.
+
     Args:
         session: A SQLAlchemy session with the database.
 
@@ -154,39 +651,423 @@ def get_meter(session: Session) -> int:
         The int count of the Masa meter.
     """
 
-    stmt: Select = select(func.count(MasaMention.id))
+    state: MeterState | None = session.get(MeterState, METER_STATE_ID)
+
+    if state is None:
+        return _count_mentions(session)
+
+    return state.count
 
-    result: int = session.scalar(stmt)
-    return result
 
+def get_data_version(session: Session) -> int:
+    """Fetch the data version of the masa_mentions table.
 
-def get_history(session: Session) -> Result:
-    """Retrieve all records in the MasaMention table.
+    The version increases with every transaction that inserts or deletes
+    MasaMention entries, so it can key caches of derived data.
 
     Args:
         session: A SQLAlchemy session with the database.
 
+    Returns:
+        The int data version, or 0 if the meter_state row has not been seeded.
+    """
+
+    stmt: Select = select(MeterState.version).where(
+        MeterState.id == METER_STATE_ID
+    )
+
+    return session.scalar(stmt) or 0
+
+
+def reconcile_meter(session: Session) -> Tuple[int | None, int]:
+    """Recompute the materialized meter from the masa_mentions table.
+
+    Overwrites the meter_state row with the actual number of MasaMention
+    entries, creating the row if it does not exist.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+
+    Returns:
+        A tuple in the form (stored, actual) where stored is the meter value
+        before reconciling (None if the row did not exist) and actual is the
+        recomputed count. The drift is actual - stored.
+    """
+
+    actual: int = _count_mentions(session)
+    state: MeterState | None = session.get(MeterState, METER_STATE_ID)
+
+    if state is None:
+        stored: int | None = None
+        session.add(MeterState(id=METER_STATE_ID, count=actual, version=1))
+    else:
+        stored = state.count
+        state.count = actual
+        state.version += 1
+
+    session.commit()
+
+    return stored, actual
+
+
+def reconcile_speaker_stats(
+        session: Session
+) -> list[Tuple[str, int | None, int | None]]:
+    """Rebuild the speaker_stats table from the masa_mentions table.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+
+    Returns:
+        A list of (username, stored, actual) tuples for every speaker whose
+        stored stats differed from the recomputed ones. stored or actual is
+        None if the speaker was missing from that side.
+    """
+
+    actual: dict[str, tuple] = {
+        username: (total, first_ts, last_ts)
+        for username, total, first_ts, last_ts in session.execute(
+            select(
+                MasaMention.speaker_username,
+                func.count(MasaMention.id),
+                func.min(MasaMention.ts),
+                func.max(MasaMention.ts)
+            )
+            .where(MasaMention.speaker_username.is_not(None))
+            .group_by(MasaMention.speaker_username)
+        )
+    }
+    stored: dict[str, tuple] = {
+        username: (total, first_ts, last_ts)
+        for username, total, first_ts, last_ts in session.execute(
+            select(
+                SpeakerStats.username,
+                SpeakerStats.total,
+                SpeakerStats.first_ts,
+                SpeakerStats.last_ts
+            )
+        )
+    }
+
+    drift: list[Tuple[str, int | None, int | None]] = [
+        (
+            username,
+            stored[username][0] if username in stored else None,
+            actual[username][0] if username in actual else None
+        )
+        for username in sorted(actual.keys() | stored.keys())
+        if stored.get(username) != actual.get(username)
+    ]
+
+    session.execute(delete(SpeakerStats))
+
+    if actual:
+        session.execute(insert(SpeakerStats), [
+            {
+                "username": username,
+                "total": total,
+                "first_ts": first_ts,
+                "last_ts": last_ts
+            }
+            for username, (total, first_ts, last_ts) in actual.items()
+        ])
+
+    session.commit()
+
+    return drift
+
+
+def reconcile_daily_counts(session: Session) -> int:
+    """Rebuild the daily_counts table from the masa_mentions table.
+
+    Also serves as the backfill for databases that predate the table.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+
+    Returns:
+        The int number of (day, speaker) rows whose stored count differed from
+        the recomputed one, including rows that were missing or obsolete.
+    """
+
+    mention_day = MasaMention.ts // MS_PER_DAY
+
+    actual: dict[Tuple[int, str], int] = {
+        (day, username): count
+        for day, username, count in session.execute(
+            select(
+                mention_day,
+                MasaMention.speaker_username,
+                func.count(MasaMention.id)
+            )
+            .where(MasaMention.speaker_username.is_not(None))
+            .group_by(mention_day, MasaMention.speaker_username)
+        )
+    }
+    stored: dict[Tuple[int, str], int] = {
+        (day, username): count
+        for day, username, count in session.execute(
+            select(
+                DailyCount.day, DailyCount.speaker_username, DailyCount.count
+            )
+        )
+    }
+
+    drift: int = sum(
+        1 for key in actual.keys() | stored.keys()
+        if actual.get(key) != stored.get(key)
+    )
+
+    session.execute(delete(DailyCount))
+
+    if actual:
+        session.execute(insert(DailyCount), [
+            {"day": day, "speaker_username": username, "count": count}
+            for (day, username), count in actual.items()
+        ])
+
+    session.commit()
+
+    return drift
+
+
+def get_history(session: Session, yield_per: int | None = None) -> Result:
+    """Retrieve all records in the MasaMention table, oldest first.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        yield_per:
+            If given, rows are fetched from the cursor in batches of this size
+            as the result is iterated, instead of all at once, so memory use
+            does not grow with the table.
+
     Returns:
         The SQL Alchemy result object containing every MasaMention entry.
         Each entry is organized as a tuple in the form:
-            (id, date, speaker_username)
+            (date, speaker_username)
     """
 
     stmt: Select = (
         select(MasaMention.date, MasaMention.speaker_username)
+        .order_by(MasaMention.ts, MasaMention.id)
     )
 
+    if yield_per is not None:
+        stmt = stmt.execution_options(yield_per=yield_per)
+
     results: Result = session.execute(stmt)
 
     return results
 
 
-def get_leaderboard(session: Session) -> Result:
+def get_history_page(
+        session: Session,
+        limit: int,
+        cursor: Tuple[int, str] | None = None,
+        before: int | None = None,
+        after: int | None = None,
+        speaker: str | None = None
+) -> list[Row]:
+    """Retrieve one page of MasaMention entries, newest first.
+
+    Pages are keyset-paginated on (ts, id) so every page is an index range
+    scan, no matter how deep into the history it is.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        limit: The maximum number of entries in the page.
+        cursor:
+            The (ts, id) of the last entry of the previous page. Only entries
+            that sort after it are returned.
+        before: Only return entries with ts lower than this epoch millisecond.
+        after: Only return entries with ts at or above this epoch millisecond.
+        speaker: Only return entries attached to this Speaker's username.
+
+    Returns:
+        A list of at most limit rows in the form:
+            (ts, id, date, speaker_username)
+    """
+
+    stmt: Select = select(
+        MasaMention.ts,
+        MasaMention.id,
+        MasaMention.date,
+        MasaMention.speaker_username
+    )
+
+    if cursor is not None:
+        stmt = stmt.where(tuple_(MasaMention.ts, MasaMention.id) < cursor)
+
+    if before is not None:
+        stmt = stmt.where(MasaMention.ts < before)
+
+    if after is not None:
+        stmt = stmt.where(MasaMention.ts >= after)
+
+    if speaker is not None:
+        stmt = stmt.where(MasaMention.speaker_username == speaker)
+
+    stmt = (
+        stmt.order_by(MasaMention.ts.desc(), MasaMention.id.desc())
+        .limit(limit)
+    )
+
+    return session.execute(stmt).all()
+
+
+def get_history_since(
+        session: Session,
+        cursor: Tuple[int, frozenset[str]] | None,
+        limit: int
+) -> list[Row]:
+    """Retrieve the newest MasaMention entries not seen yet.
+
+    Ids are random, so an entry committed later in the same millisecond as
+    one already seen may sort before it. Entries at the cursor's ts are
+    therefore matched against the ids already seen instead.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        cursor:
+            The (ts, ids) of the newest ts already seen and the ids of the
+            entries seen at that ts, or None to start from the beginning of
+            the history.
+        limit: The maximum number of entries to return.
+
+    Returns:
+        A list of at most limit rows, newest first, in the form:
+            (ts, id, date, speaker_username)
+    """
+
+    stmt: Select = select(
+        MasaMention.ts,
+        MasaMention.id,
+        MasaMention.date,
+        MasaMention.speaker_username
+    )
+
+    if cursor is not None:
+        ts, seen = cursor
+        stmt = stmt.where(or_(
+            MasaMention.ts > ts,
+            and_(MasaMention.ts == ts, MasaMention.id.not_in(seen))
+        ))
+
+    stmt = (
+        stmt.order_by(MasaMention.ts.desc(), MasaMention.id.desc())
+        .limit(limit)
+    )
+
+    return session.execute(stmt).all()
+
+
+def _day_bucket_start(day: ColumnElement, bucket: str) -> ColumnElement:
+    """Build the SQL expression of the bucket a day falls into.
+
+    Weeks start on Monday and every bucket is in UTC.
+
+    Args:
+        day: An expression of days since the Unix epoch.
+        bucket: "day", "week", or "month".
+
+    Returns:
+        An expression of the epoch milliseconds the bucket starts at.
+    """
+
+    if bucket == "day":
+        return day * MS_PER_DAY
+
+    if bucket == "week":
+        # The epoch was a Thursday, three days after the start of its week.
+        return ((day + 3) // 7 * 7 - 3) * MS_PER_DAY
+
+    month: ColumnElement = func.strftime(
+        "%Y-%m-01", day * 86_400, "unixepoch"
+    )
+
+    return cast(func.strftime("%s", month), Integer) * 1000
+
+
+def get_series(
+        session: Session,
+        bucket: str,
+        start: int | None = None,
+        end: int | None = None,
+        speaker: str | None = None
+) -> list[Row]:
+    """Count MasaMention entries per time bucket.
+
+    Day, week, and month buckets are summed from the daily_counts table when
+    start and end fall on day boundaries. Otherwise (and for hour buckets)
+    the masa_mentions table is grouped directly through its ts indexes.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+        bucket: One of SERIES_BUCKETS.
+        start: Only count entries with ts at or above this epoch millisecond.
+        end: Only count entries with ts lower than this epoch millisecond.
+        speaker: Only count entries attached to this Speaker's username.
+
+    Returns:
+        A list of rows in the form (bucket_start, count), ordered by
+        bucket_start (epoch milliseconds). Buckets without entries are
+        omitted.
+
+    Raises:
+        ValueError: If bucket is not one of SERIES_BUCKETS.
+    """
+
+    if bucket not in SERIES_BUCKETS:
+        raise ValueError(f"Unknown bucket {bucket!r}")
+
+    day_aligned: bool = all(
+        bound is None or bound % MS_PER_DAY == 0 for bound in (start, end)
+    )
+    stmt: Select
+
+    if bucket != "hour" and day_aligned:
+        key: ColumnElement = _day_bucket_start(DailyCount.day, bucket)
+        stmt = select(key, func.sum(DailyCount.count))
+
+        if start is not None:
+            stmt = stmt.where(DailyCount.day >= start // MS_PER_DAY)
+
+        if end is not None:
+            stmt = stmt.where(DailyCount.day < end // MS_PER_DAY)
+
+        if speaker is not None:
+            stmt = stmt.where(DailyCount.speaker_username == speaker)
+    else:
+        if bucket == "hour":
+            key = MasaMention.ts // MS_PER_HOUR * MS_PER_HOUR
+        else:
+            key = _day_bucket_start(MasaMention.ts // MS_PER_DAY, bucket)
+
+        stmt = select(key, func.count())
+
+        if start is not None:
+            stmt = stmt.where(MasaMention.ts >= start)
+
+        if end is not None:
+            stmt = stmt.where(MasaMention.ts < end)
+
+        if speaker is not None:
+            stmt = stmt.where(MasaMention.speaker_username == speaker)
+
+    stmt = stmt.group_by(key).order_by(key)
+
+    return session.execute(stmt).all()
+
+
+def get_leaderboard(session: Session, limit: int | None = None) -> Result:
     """Retrieve the Speaker's with the most entries in the MasaMention table.
 
+    Reads the materialized speaker_stats table through its total index, so the
+    cost scales with the number of speakers rather than mentions.
 
     Args:
         session: A SQLAlchemy session with the database.
+        limit: If given, only the top limit speakers are returned.
 
     Returns:
         The SQL Alchemy result object containing speakers ordered from most to
@@ -195,9 +1076,10 @@ def get_leaderboard(session: Session) -> Result:
     """
 
     stmt: Select = (
-        select(MasaMention.speaker_username, func.count(MasaMention.id))
-        .group_by(MasaMention.speaker_username)
-        .order_by(func.count(MasaMention.id).desc())
+        select(SpeakerStats.username, SpeakerStats.total)
+        .where(SpeakerStats.total > 0)
+        .order_by(SpeakerStats.total.desc())
+        .limit(limit)
     )
 
     results: Result = session.execute(stmt)
@@ -206,92 +1088,113 @@ def get_leaderboard(session: Session) -> Result:
 
 
 def _get_birthday() -> Tuple[datetime, datetime]:
+    """Compute the date range searched by the Special Sushi achievement.
+
+    Returns:
+        A tuple in the form (start, end). The range starts at this year's
+        birthday, or last year's if this year's has already passed, and ends at
+        next year's birthday.
     """
-    """
-    
+
     birthday_str: str = "-09-14T05:00:00+00:00"
     current_date: datetime = datetime.now(timezone.utc)
     current_year: int = current_date.year
-    birthday_str = str(current_year) + birthday_str
-    birthday_date: datetime = datetime.fromisoformat(birthday_str)
+    birthday_date: datetime = datetime.fromisoformat(
+        str(current_year) + birthday_str
+    )
 
     if current_date > birthday_date:
-        birthday_date = str(current_year - 1) + birthday_str
+        birthday_date = datetime.fromisoformat(
+            str(current_year - 1) + birthday_str
+        )
 
-    end_date = str(current_year + 1) + birthday_str
+    end_date: datetime = datetime.fromisoformat(
+        str(current_year + 1) + birthday_str
+    )
 
     return birthday_date, end_date
 
 
-def get_achievements(session: Session) -> list[str]:
-    """
+def get_achievements_key() -> int:
+    """Identify the date range get_achievements currently searches.
+
+    Returns:
+        The year of the birthday that starts the Special Sushi range.
     """
 
-    achievements_list: list[str] = []
+    return _get_birthday()[0].year
 
-    # Masa Master: Who said it the most
 
-    stmt: Select = (
-        select(MasaMention.speaker_username)
-        .group_by(MasaMention.speaker_username)
-        .order_by(func.count(MasaMention.id).desc())
-        .limit(1)
-    )
-    achievements_list.append(session.scalar(stmt))
+def get_achievements(session: Session) -> list[str]:
+    """Determine the username that holds each achievement.
 
-    # Silent Sashimi: Who said it the least
+    Computes all five achievements in one pass over the materialized
+    speaker_stats and daily_counts tables plus one indexed range query, instead
+    of one aggregate query over masa_mentions per achievement.
 
-    stmt = (
-        select(MasaMention.speaker_username)
-        .group_by(MasaMention.speaker_username)
-        .order_by(func.count(MasaMention.id).asc())
-        .limit(1)
-    )
-    achievements_list.append(session.scalar(stmt))
+    Args:
+        session: A SQLAlchemy session with the database.
 
-    # Tempura Titan: Who said it the most in one day
+    Returns:
+        A list of usernames, or None where nobody holds the achievement, in
+        the order: Masa Master, Silent Sashimi, Tempura Titan, Nigiri Ninja,
+        Special Sushi.
+    """
 
-    subq: Subquery = (
-        select(
-            MasaMention.speaker_username,
-            MasaMention.date, func.count(MasaMention.date).label("masa_count")
-        )
-        .group_by(MasaMention.speaker_username, func.date(MasaMention.date))
-        .subquery()
-    )
+    # Masa Master: Who said it the most
+    # Silent Sashimi: Who said it the least
 
-    stmt = (
-        select(subq.c.speaker_username)
-        .group_by(subq.c.speaker_username)
-        .order_by(func.max(subq.c.masa_count).desc())
-        .limit(1)
-    )
+    masa_master: str | None = None
+    silent_sashimi: str | None = None
+    most: int = 0
+    least: int | None = None
+
+    for username, total in session.execute(
+        select(SpeakerStats.username, SpeakerStats.total)
+    ):
+        if total > most:
+            masa_master, most = username, total
 
-    achievements_list.append(session.scalar(stmt))
+        if least is None or total < least:
+            silent_sashimi, least = username, total
 
+    # Tempura Titan: Who said it the most in one day
     # Nigiri Ninja: Who is the only one to say it on a day
 
-    stmt = (
-        select(MasaMention.speaker_username)
-        .group_by(func.date(MasaMention.date))
-        .having(1 == func.count(MasaMention.date))
-        .order_by(func.count(MasaMention.date).desc())
-        .limit(1)
+    tempura_titan: str | None = None
+    best_day: int = 0
+    day_totals: dict[int, int] = {}
+    day_speakers: dict[int, str] = {}
+
+    for day, username, count in session.execute(
+        select(DailyCount.day, DailyCount.speaker_username, DailyCount.count)
+        .order_by(DailyCount.day)
+    ):
+        if count > best_day:
+            tempura_titan, best_day = username, count
+
+        day_totals[day] = day_totals.get(day, 0) + count
+        day_speakers[day] = username
+
+    nigiri_ninja: str | None = next(
+        (day_speakers[day] for day, total in day_totals.items() if total == 1),
+        None
     )
-    achievements_list.append(session.scalar(stmt))
 
     # Special Sushi: Who said it on my birthday
 
     birthday_dates: Tuple[datetime, datetime] = _get_birthday()
 
-    stmt = (
+    stmt: Select = (
         select(MasaMention.speaker_username)
         .where(
-            (MasaMention.date >= birthday_dates[0]) &
-            (MasaMention.date < birthday_dates[1])
+            (MasaMention.ts >= to_epoch_ms(birthday_dates[0])) &
+            (MasaMention.ts < to_epoch_ms(birthday_dates[1]))
         )
         .limit(1)
     )
-    achievements_list.append(session.scalar(stmt))
+    special_sushi: str | None = session.scalar(stmt)
 
-    return achievements_list
\ No newline at end of file
+    return [
+        masa_master, silent_sashimi, tempura_titan, nigiri_ninja, special_sushi
+    ]
@@ -27,26 +27,118 @@ Provide a SQLAlchemy engine connected to SQLite, a session factory for database
 operations, and a declarative base for defining ORM models. Include a context
 manager to safely open and close database sessions.
 
+The bot and API share one SQLite file, so every connection is switched to WAL
+mode with synchronous=NORMAL and a busy timeout. Readers then work from a
+snapshot instead of blocking on (or blocking) the writer.
+
 Attributes:
     engine: A database connection to SQLite3.
     SessionLocal: A factory for creating database sessions.
+    async_engine: An asyncio database connection to SQLite3 (aiosqlite).
+    AsyncSessionLocal: A factory for creating asyncio database sessions.
     Base: Adeclarative base for ORM models.
 """
 
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from sqlite3 import Connection, Cursor
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+)
 from sqlalchemy.orm import (
     DeclarativeMeta, Session, declarative_base, sessionmaker
 )
+from sqlalchemy.pool import ConnectionPoolEntry
+
+from config import (
+    DATABASE_BUSY_TIMEOUT_MS, DATABASE_CACHE_SIZE_KIB, DATABASE_MAX_OVERFLOW,
+    DATABASE_MMAP_SIZE, DATABASE_PATH, DATABASE_POOL_SIZE,
+    DATABASE_POOL_TIMEOUT
+)
+
+
+_ENGINE_OPTIONS: dict = {
+    "pool_size": DATABASE_POOL_SIZE,
+    "max_overflow": DATABASE_MAX_OVERFLOW,
+    "pool_timeout": DATABASE_POOL_TIMEOUT,
+    "connect_args": {"timeout": DATABASE_BUSY_TIMEOUT_MS / 1000},
+}
+
+
+def _set_sqlite_pragmas(
+        dbapi_connection: Connection, connection_record: ConnectionPoolEntry
+) -> None:
+    """Tune every new SQLite connection for concurrent readers and a writer.
+
+    Args:
+        dbapi_connection: The raw DBAPI connection that was just opened.
+        connection_record: The pool entry holding the connection.
+
+    Returns:
+        None
+    """
+
+    cursor: Cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={DATABASE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA cache_size=-{DATABASE_CACHE_SIZE_KIB}")
+    cursor.execute(f"PRAGMA mmap_size={DATABASE_MMAP_SIZE}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 
-from config import DATABASE_PATH
+def create_db_engine(path: Path = DATABASE_PATH) -> Engine:
+    """Create an engine for a SQLite database file.
+
+    Connections are pooled according to the DATABASE_POOL_* settings in
+    config.py and tuned by _set_sqlite_pragmas when they are opened.
+
+    Args:
+        path: The path of the SQLite database file.
+
+    Returns:
+        A SQLAlchemy engine connected to the database file.
+    """
+
+    engine: Engine = create_engine(f"sqlite:///{path}", **_ENGINE_OPTIONS)
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
+    return engine
+
+
+def create_async_db_engine(path: Path = DATABASE_PATH) -> AsyncEngine:
+    """Create an asyncio engine for a SQLite database file.
+
+    Uses the aiosqlite driver, which runs every SQLite call on a worker thread
+    so the event loop is never blocked by disk I/O or lock waits. Pooling and
+    pragmas match create_db_engine.
+
+    Args:
+        path: The path of the SQLite database file.
+
+    Returns:
+        A SQLAlchemy asyncio engine connected to the database file.
+    """
 
+    engine: AsyncEngine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", **_ENGINE_OPTIONS
+    )
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
 
-engine: Engine = create_engine(f"sqlite:///{DATABASE_PATH}")
+    return engine
+
+
+engine: Engine = create_db_engine()
 SessionLocal: sessionmaker[Session] = sessionmaker(
     autocommit=False, autoflush=False, bind=engine
 )
+async_engine: AsyncEngine = create_async_db_engine()
+AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=async_engine
+)
 Base: DeclarativeMeta = declarative_base()
 
 
@@ -74,3 +166,47 @@ def get_session() -> Session:
         yield session
     finally:
         session.close()
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncSession:
+    """Open an asyncio session safely and ensure it closes after completion.
+
+    The asyncio counterpart of get_session for code running on an event loop,
+    such as the Discord bot cogs.
+
+    Returns:
+        A SQLAlchemy asyncio session object bound to the asyncio engine.
+
+    Raises:
+        SQLAlchemyError: An error occurs while creating the session.
+
+    Example:
+        async with get_async_session() as session:
+            result = await get_meter(session)
+    """
+
+    session: AsyncSession = AsyncSessionLocal()
+
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+def begin_read(session: Session) -> None:
+    """Start an explicit read transaction on a session.
+
+    The sqlite3 driver only opens a transaction before data-modifying
+    statements, so consecutive SELECTs would otherwise each see the latest
+    commit. Under WAL, every query after BEGIN reads the same snapshot until
+    the session is closed or rolled back. Call it before the first query.
+
+    Args:
+        session: A SQLAlchemy session with the database.
+
+    Returns:
+        None
+    """
+
+    session.execute(text("BEGIN"))
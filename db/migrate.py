@@ -0,0 +1,177 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Migrate an existing Masa Meter database to the current schema in place.
+
+Every step checks the current schema first, so the migration is safe to run
+repeatedly against data/masa_meter.db. The steps are:
+
+    1. Create tables that do not exist yet.
+    2. Add the integer ts column (epoch milliseconds) and the message_id
+       column to masa_mentions and the version and message_ids_since columns
+       to meter_state.
+    3. Backfill ts from the ISO-8601 date column.
+    4. Create the masa_mentions indexes.
+    5. Rebuild the materialized tables (see db.reconcile).
+    6. When the message_id column is added, record when mentions started
+       recording their message id, so /backfill does not count the mentions
+       from before a second time.
+
+Examples:
+    python -m db.migrate
+"""
+
+from sqlalchemy import (
+    Connection, Result, Table, bindparam, inspect, select, text, update
+)
+
+from db import reconcile
+from db.crud import seed_message_ids_since
+from db.database import Base, engine, get_session
+from db.models import MasaMention, to_epoch_ms
+
+
+BATCH_SIZE: int = 1000
+
+
+def _add_column(
+        connection: Connection, table: str, column: str, definition: str
+) -> bool:
+    """Add a column to a table if it is missing.
+
+    Args:
+        connection: A SQLAlchemy connection with the database.
+        table: The name of the table.
+        column: The name of the column.
+        definition: The SQL type and constraints of the column.
+
+    Returns:
+        True if the column was added; otherwise False.
+    """
+
+    columns: list[dict] = inspect(connection).get_columns(table)
+
+    if any(existing["name"] == column for existing in columns):
+        return False
+
+    connection.execute(
+        text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    )
+
+    return True
+
+
+def _backfill_ts(connection: Connection) -> int:
+    """Fill in ts for every mention that does not have one yet.
+
+    Args:
+        connection: A SQLAlchemy connection with the database.
+
+    Returns:
+        The int number of mentions that were backfilled.
+    """
+
+    table: Table = MasaMention.__table__
+    backfilled: int = 0
+
+    while True:
+        results: Result = connection.execute(
+            select(MasaMention.id, MasaMention.date)
+            .where(MasaMention.ts.is_(None))
+            .limit(BATCH_SIZE)
+        )
+        rows: list[dict] = [
+            {"mention_id": mention_id, "new_ts": to_epoch_ms(date)}
+            for mention_id, date in results
+        ]
+
+        if not rows:
+            return backfilled
+
+        connection.execute(
+            update(table)
+            .where(table.c.id == bindparam("mention_id"))
+            .values(ts=bindparam("new_ts")),
+            rows
+        )
+        connection.commit()
+
+        backfilled += len(rows)
+
+
+def main() -> None:
+    """Run every migration step and print what changed.
+
+    Returns:
+        None
+    """
+
+    Base.metadata.create_all(engine)
+
+    with engine.connect() as connection:
+        if _add_column(connection, "masa_mentions", "ts", "BIGINT"):
+            connection.commit()
+            print("masa_mentions: added ts column")
+
+        added_message_id: bool = _add_column(
+            connection, "masa_mentions", "message_id", "BIGINT"
+        )
+
+        if added_message_id:
+            connection.commit()
+            print("masa_mentions: added message_id column")
+
+        if _add_column(
+                connection, "meter_state", "version",
+                "INTEGER NOT NULL DEFAULT 0"
+        ):
+            connection.commit()
+            print("meter_state: added version column")
+
+        if _add_column(
+                connection, "meter_state", "message_ids_since", "BIGINT"
+        ):
+            connection.commit()
+            print("meter_state: added message_ids_since column")
+
+        backfilled: int = _backfill_ts(connection)
+        print(f"masa_mentions: backfilled ts for {backfilled} rows")
+
+        for index in MasaMention.__table__.indexes:
+            index.create(connection, checkfirst=True)
+
+        connection.commit()
+        print("masa_mentions: indexes are up to date")
+
+    reconcile.main()
+
+    # Only the mentions that existed before the column lack a message id.
+    if added_message_id:
+        with get_session() as session:
+            since: int | None = seed_message_ids_since(session)
+
+        if since is not None:
+            print(f"masa_mentions: message ids recorded since {since}")
+
+
+if __name__ == "__main__":
+    main()
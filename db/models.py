@@ -26,15 +26,55 @@ Provide models to represent speakers and mentions of "Sushi Masa" in the
 database.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import uuid
 
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Integer, String
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.orm import relationship
 
 from db.database import Base, engine
 
 
+EPOCH: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MS_PER_HOUR: int = 3_600_000
+MS_PER_DAY: int = 86_400_000
+
+
+def to_epoch_ms(date: datetime | str) -> int:
+    """Convert a datetime or ISO-formatted string to epoch milliseconds.
+
+    Naive datetimes are treated as UTC.
+
+    Args:
+        date: The datetime or ISO-8601 string to convert.
+
+    Returns:
+        The int number of milliseconds since the Unix epoch.
+    """
+
+    if isinstance(date, str):
+        date = datetime.fromisoformat(date)
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return (date - EPOCH) // timedelta(milliseconds=1)
+
+
+def _ts_default(context: DefaultExecutionContext) -> int:
+    """Derive the default ts of a MasaMention from its date column.
+
+    Args:
+        context: The SQLAlchemy execution context of the insert.
+
+    Returns:
+        The epoch milliseconds of the mention's date.
+    """
+
+    return to_epoch_ms(context.get_current_parameters()["date"])
+
+
 class Speaker(Base):
     """Represent a person who has said "Sushi Masa".
 
@@ -55,8 +95,13 @@ class MasaMention(Base):
     Attributes:
         id: Primary key for the mention.
         date: ISO-formatted date when the mentioned occured.
+        ts: The same instant as date in epoch milliseconds (indexed).
         speaker_username:
             Foreign key to the Speaker's username who mentioned "Sushi Masa".
+        message_id:
+            Discord id of the message the mention was detected in, or of the
+            interaction of the command that added it (unique). None for
+            mentions recorded before message ids were.
         speaker: The related Speaker object.
     """
 
@@ -65,10 +110,117 @@ class MasaMention(Base):
     date = Column(
         String, default=lambda: datetime.now(timezone.utc).isoformat()
     )
+    ts = Column(BigInteger, default=_ts_default)
     speaker_username = Column(String(50), ForeignKey("speakers.username"))
+    message_id = Column(BigInteger, nullable=True)
 
     speaker = relationship("Speaker", back_populates="mentions")
 
+    __table_args__ = (
+        Index(
+            "ix_masa_mentions_speaker_ts_id", "speaker_username", "ts", "id"
+        ),
+        Index("ix_masa_mentions_ts_id", "ts", "id"),
+        Index("ux_masa_mentions_message_id", "message_id", unique=True),
+    )
+
+
+class SpeakerStats(Base):
+    """Represent the materialized mention totals of a speaker.
+
+    Rows are updated in the same transaction as every MasaMention insert or
+    delete, so the leaderboard reads one row per speaker instead of grouping
+    the whole masa_mentions table.
+
+    Attributes:
+        username: The Discord username of the speaker [Primary Key].
+        total: Number of MasaMention entries attached to the speaker.
+        first_ts: Epoch milliseconds of the speaker's first mention.
+        last_ts: Epoch milliseconds of the speaker's latest mention.
+    """
+
+    __tablename__ = "speaker_stats"
+    username = Column(
+        String(50), ForeignKey("speakers.username"), primary_key=True
+    )
+    total = Column(Integer, nullable=False, default=0)
+    first_ts = Column(BigInteger)
+    last_ts = Column(BigInteger)
+
+    __table_args__ = (
+        Index("ix_speaker_stats_total", "total"),
+    )
+
+
+class DailyCount(Base):
+    """Represent the materialized number of mentions by a speaker in one day.
+
+    Rows are updated in the same transaction as every MasaMention insert or
+    delete, so per-day statistics read O(days x speakers) rows instead of
+    grouping the whole masa_mentions table.
+
+    Attributes:
+        day: Days since the Unix epoch (UTC), i.e. ts // MS_PER_DAY.
+        speaker_username: The Discord username of the speaker.
+        count: Number of MasaMention entries by the speaker on that day.
+    """
+
+    __tablename__ = "daily_counts"
+    day = Column(Integer, primary_key=True)
+    speaker_username = Column(
+        String(50), ForeignKey("speakers.username"), primary_key=True
+    )
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_daily_counts_count", "count"),
+    )
+
+
+class MeterState(Base):
+    """Represent the materialized Masa meter.
+
+    The table holds a single row that is updated in the same transaction as
+    every MasaMention insert or delete, so reading the meter is a primary key
+    lookup instead of a count over the whole masa_mentions table.
+
+    Attributes:
+        id: Primary key of the meter row (always METER_STATE_ID).
+        count: Number of MasaMention entries in the database.
+        version:
+            Data version that increases with every transaction that inserts or
+            deletes MasaMention entries.
+        message_ids_since:
+            Epoch millisecond from which detected mentions record their
+            message id, or None if the database has no mentions from before.
+    """
+
+    __tablename__ = "meter_state"
+    id = Column(Integer, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    message_ids_since = Column(BigInteger, nullable=True)
+
+
+METER_STATE_ID: int = 1
+
+
+class BackfillCheckpoint(Base):
+    """Represent how far the history of a channel has been backfilled.
+
+    Attributes:
+        channel_id: The Discord id of the text channel [Primary Key].
+        last_message_id: The Discord id of the newest message scanned.
+        scanned: Number of messages scanned in the channel.
+        found: Number of mentions added from the channel.
+    """
+
+    __tablename__ = "backfill_checkpoints"
+    channel_id = Column(BigInteger, primary_key=True)
+    last_message_id = Column(BigInteger, nullable=False)
+    scanned = Column(Integer, nullable=False, default=0)
+    found = Column(Integer, nullable=False, default=0)
+
 
 if __name__ == "__main__":
     Base.metadata.drop_all(engine)
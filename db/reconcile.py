@@ -0,0 +1,71 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Recompute materialized counters from the masa_mentions table.
+
+Compare the stored meter, speaker stats, and daily counts against the
+masa_mentions table, report any drift, and overwrite the stored values with the
+recomputed ones. Materialized tables are created and backfilled if the database
+predates them.
+
+Examples:
+    python -m db.reconcile
+"""
+
+from db.crud import (
+    reconcile_daily_counts, reconcile_meter, reconcile_speaker_stats
+)
+from db.database import Base, engine, get_session
+import db.models  # noqa: F401  Registers the tables on Base.metadata.
+
+
+def main() -> None:
+    """Reconcile every materialized table and print a drift report.
+
+    Returns:
+        None
+    """
+
+    Base.metadata.create_all(engine)
+
+    with get_session() as session:
+        stored, actual = reconcile_meter(session)
+        speaker_drift: list = reconcile_speaker_stats(session)
+        daily_drift: int = reconcile_daily_counts(session)
+
+    if stored is None:
+        print(f"meter: seeded with {actual}")
+    elif stored == actual:
+        print(f"meter: {actual} (no drift)")
+    else:
+        print(f"meter: {stored} -> {actual} (drift {actual - stored:+d})")
+
+    print(f"speaker_stats: {len(speaker_drift)} speaker(s) drifted")
+
+    for username, stored, actual in speaker_drift:
+        print(f"    {username}: {stored} -> {actual}")
+
+    print(f"daily_counts: {daily_drift} (day, speaker) row(s) drifted")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import shared from "@styles/shared.module.css";
 import type { AchievementEntry } from "@/types";
 import Achievement from "./Achievement";
+import { fetchDashboard } from "@/dashboard";
+import { subscribe } from "@/events";
 import { useEffect, useState } from "react";
 
 
@@ -15,10 +17,12 @@ const AchievementWidget = () => {
                 .catch(error => console.error(error));
         }
 
-        updateAchievement();
-        const interval = setInterval(updateAchievement, 30000);
+        // The first load shares the page's dashboard request; meter changes refetch.
+        fetchDashboard()
+            .then((data) => setAchievementData(data.achievements))
+            .catch(error => console.error(error));
 
-        return () => clearInterval(interval);
+        return subscribe("meter", updateAchievement);
     }, []);
 
     return (
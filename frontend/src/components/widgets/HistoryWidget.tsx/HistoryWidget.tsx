@@ -1,6 +1,8 @@
 import shared from "@styles/shared.module.css";
 import type { HistoryEntry } from "@/types.ts";
 import History from "./History";
+import { fetchDashboard } from "@/dashboard";
+import { subscribe } from "@/events";
 import { useEffect, useState } from "react";
 
 
@@ -8,25 +10,21 @@ const HistoryWidget = () => {
     const [historyData, setHistoryData] = useState<HistoryEntry[]>([]);
 
     useEffect(() => {
-        const updateHistory = () => {
-            fetch("/api/history")
-                .then((response) => response.json())
-                .then((data: HistoryEntry[]) => {
-                    let tempData: HistoryEntry[] = [];
-
-                    for (let i = 1; i <= 5; i++) {
-                        tempData.push(data[data.length - i]);
-                    }
-
-                    setHistoryData(tempData);
-                })
-                .catch(error => console.error(error));
-        }
-
-        updateHistory();
-        const interval = setInterval(updateHistory, 30000);
-
-        return () => clearInterval(interval);
+        // Events are newer than the fetch, so it only fills in until the first one.
+        let live = false;
+
+        fetchDashboard()
+            .then((data) => {
+                if (!live) {
+                    setHistoryData(data.history.history);
+                }
+            })
+            .catch(error => console.error(error));
+
+        return subscribe<{ history: HistoryEntry[] }>("history", (data) => {
+            live = true;
+            setHistoryData((current) => [...data.history, ...current].slice(0, 5));
+        });
     }, []);
 
     return (
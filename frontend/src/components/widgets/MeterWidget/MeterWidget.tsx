@@ -1,22 +1,18 @@
 import logo from "@assets/images/masa_logo_big_light.png";
 import styles from "@components/widgets/MeterWidget/MeterWidget.module.css";
+import { fetchDashboard } from "@/dashboard";
+import { subscribe } from "@/events";
 import { useEffect, useState } from "react";
 
 const MeterWidget = () => {
     const [meter, setMeter] = useState(0);
 
     useEffect(() => {
-        const updateMeter = () => {
-            fetch("/api/meter")
-                .then((response) => response.json())
-                .then((data) => setMeter(data[0].meter))
-                .catch(error => console.error(error));
-        }
+        fetchDashboard()
+            .then((data) => setMeter(data.meter))
+            .catch(error => console.error(error));
 
-        updateMeter();
-        const interval = setInterval(updateMeter, 30000);
-        
-        return () => clearInterval(interval);
+        return subscribe<{ meter: number }>("meter", (data) => setMeter(data.meter));
     }, []);
     
     return (
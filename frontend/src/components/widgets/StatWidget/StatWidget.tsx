@@ -1,38 +1,56 @@
 import shared from "@styles/shared.module.css";
 import type { LeaderboardEntry } from "@/types";
 import Leaderboard from "@components/widgets/StatWidget/Leaderboard";
+import { fetchDashboard } from "@/dashboard";
+import { subscribe } from "@/events";
 import { useEffect, useState } from "react";
 
+const topFive = (counts: Map<string, number>): LeaderboardEntry[] => {
+    return [...counts]
+        .map(([username, count]) => ({ username, count }))
+        .sort((a, b) => b.count - a.count)
+        .slice(0, 5);
+}
+
 const StatWidget = () => {
-    const [leaderboardData, setLeaderboardData] = useState<LeaderboardEntry[]>([]);
+    const [counts, setCounts] = useState<Map<string, number>>(new Map());
 
     useEffect(() => {
-        const updateLeaderboard = () => {
-            fetch("/api/leaderboard")
-                .then((response) => response.json())
-                .then((data: LeaderboardEntry[]) => {
-                    let tempData: LeaderboardEntry[] = [];
-
-                    for (let i = 0; i < 5; i++) {
-                        tempData.push(data[i]);
+        // Events are newer than the fetch, so it only fills in until the first one.
+        let live = false;
+
+        fetchDashboard()
+            .then((data) => {
+                if (!live) {
+                    setCounts(new Map(data.leaderboard.map((entry) => [entry.username, entry.count])));
+                }
+            })
+            .catch(error => console.error(error));
+
+        return subscribe<{ changes: LeaderboardEntry[] }>("leaderboard", (data) => {
+            // The snapshot is empty until the API has read the leaderboard once.
+            live = live || data.changes.length > 0;
+            setCounts((current) => {
+                const next = new Map(current);
+
+                for (const change of data.changes) {
+                    if (change.count === 0) {
+                        next.delete(change.username);
+                    } else {
+                        next.set(change.username, change.count);
                     }
+                }
 
-                    setLeaderboardData(tempData);
-                })
-                .catch(error => console.error(error));
-        }
-
-        updateLeaderboard();
-        const interval = setInterval(updateLeaderboard, 30000);
-
-        return () => clearInterval(interval);
+                return next;
+            });
+        });
     }, []);
 
     return (
         <div>
             <div className={shared.widget}>
                 <h1 className={shared.widgetTitle}>Stats</h1>
-                <Leaderboard leaderboardData={leaderboardData}/> 
+                <Leaderboard leaderboardData={topFive(counts)}/> 
             </div>
         </div>
     );
@@ -0,0 +1,13 @@
+import type { Dashboard } from "@/types";
+
+// One /api/dashboard request per page load, shared by every widget.
+let dashboard: Promise<Dashboard> | null = null;
+
+export const fetchDashboard = () => {
+    if (dashboard === null) {
+        dashboard = fetch("/api/dashboard")
+            .then((response) => response.json() as Promise<Dashboard>);
+    }
+
+    return dashboard;
+}
@@ -0,0 +1,16 @@
+// One EventSource per tab, shared by every widget.
+let source: EventSource | null = null;
+
+export const subscribe = <T>(event: string, handler: (data: T) => void) => {
+    if (source === null) {
+        source = new EventSource("/api/events");
+    }
+
+    const listener = (message: MessageEvent<string>) => {
+        handler(JSON.parse(message.data) as T);
+    }
+
+    source.addEventListener(event, listener);
+
+    return () => source?.removeEventListener(event, listener);
+}
@@ -12,6 +12,11 @@ export type HistoryEntry = {
     username: string;
 }
 
+export type HistoryPage = {
+    history: HistoryEntry[];
+    next_cursor: string | null;
+}
+
 export type HistoryProps = {
     historyData: HistoryEntry[];
 }
@@ -25,4 +30,11 @@ export type AchievementEntry = {
 
 export type AchievementProps = {
     achievementData: AchievementEntry[];
-}
\ No newline at end of file
+}
+
+export type Dashboard = {
+    meter: number;
+    leaderboard: LeaderboardEntry[];
+    achievements: AchievementEntry[];
+    history: HistoryPage;
+}
@@ -0,0 +1,119 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Serve a stand-in for the Pexels search endpoint on localhost.
+
+The stub answers every GET like the Pexels search API, or fails on purpose,
+so the PhotoPool can be tested without network access or an API key. Tests
+start it in a background thread; it can also be run on its own and used by
+the API through PEXELS_URL.
+
+Examples:
+    python tests/pexels_stub.py 8765
+    PEXELS_URL=http://127.0.0.1:8765/v1/search python -m api.main
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import sys
+import threading
+import time
+
+
+class PexelsStub:
+    """A local HTTP server that answers like the Pexels search endpoint.
+
+    Attributes:
+        mode: "ok" to answer with pictures, "error" to answer 503, or "slow"
+            to answer with pictures after delay seconds.
+        delay: Seconds a "slow" answer is held back.
+        photos: Number of pictures in an "ok" answer.
+        requests: Number of requests received.
+    """
+
+    def __init__(self, port: int = 0):
+        """Bind the server without serving yet.
+
+        Args:
+            port: The port to listen on; 0 picks a free one.
+        """
+
+        self.mode: str = "ok"
+        self.delay: float = 1.0
+        self.photos: int = 3
+        self.requests: int = 0
+
+        stub: PexelsStub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                stub.requests += 1
+
+                if stub.mode == "error":
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+
+                if stub.mode == "slow":
+                    time.sleep(stub.delay)
+
+                body: bytes = json.dumps({"photos": [
+                    {"src": {"medium": f"http://127.0.0.1/{i}.jpg"}}
+                    for i in range(stub.photos)
+                ]}).encode()
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer(
+            ("127.0.0.1", port), Handler
+        )
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}/v1/search"
+
+    def __enter__(self) -> "PexelsStub":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+if __name__ == "__main__":
+    with PexelsStub(int(sys.argv[1]) if len(sys.argv) > 1 else 8765) as stub:
+        print(f"Serving {stub.url}")
+        threading.Event().wait()
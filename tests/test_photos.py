@@ -0,0 +1,123 @@
+# MIT License
+#
+# Copyright (c) 2025 Justin Nguyen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the PhotoPool refresh, timeout, and retry paths against PexelsStub."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from api.photos import PhotoPool
+
+from pexels_stub import PexelsStub
+
+
+async def _wait_for(condition, timeout: float = 5.0) -> None:
+    """Poll until condition() is true or fail after timeout seconds."""
+
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+def test_refresh_fills_the_pool() -> None:
+    with PexelsStub() as stub:
+        pool: PhotoPool = PhotoPool(url=stub.url, api_key="key")
+
+        assert pool.pick() is None
+        assert asyncio.run(pool.refresh()) == 3
+        assert pool.pick() in pool.photos
+        assert pool.stats()["size"] == 3
+
+
+def test_failed_refresh_keeps_the_last_good_pool() -> None:
+    with PexelsStub() as stub:
+        pool: PhotoPool = PhotoPool(url=stub.url)
+        asyncio.run(pool.refresh())
+        photos: list[str] = pool.photos
+
+        stub.mode = "error"
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(pool.refresh())
+
+        assert pool.photos == photos
+
+
+def test_refresh_times_out() -> None:
+    with PexelsStub() as stub:
+        stub.mode = "slow"
+        pool: PhotoPool = PhotoPool(url=stub.url, timeout=0.2)
+
+        with pytest.raises(httpx.TimeoutException):
+            asyncio.run(pool.refresh())
+
+        assert pool.photos == []
+
+
+def test_background_refresh_retries_after_errors() -> None:
+    async def run(stub: PexelsStub) -> None:
+        pool: PhotoPool = PhotoPool(
+            url=stub.url, refresh_interval=60, retry_interval=0.05
+        )
+        stub.mode = "error"
+        pool.start()
+
+        try:
+            await _wait_for(lambda: pool.failures >= 2)
+            assert pool.pick() is None
+
+            stub.mode = "ok"
+            await _wait_for(lambda: pool.failures == 0)
+            assert pool.stats()["size"] == 3
+
+            # Back on the refresh interval: no further requests.
+            requests: int = stub.requests
+            await asyncio.sleep(0.2)
+            assert stub.requests == requests
+        finally:
+            await pool.stop()
+
+    with PexelsStub() as stub:
+        asyncio.run(run(stub))
+
+
+def test_background_refresh_retries_after_timeouts() -> None:
+    async def run(stub: PexelsStub) -> None:
+        pool: PhotoPool = PhotoPool(
+            url=stub.url, timeout=0.1, refresh_interval=60, retry_interval=0.05
+        )
+        stub.mode = "slow"
+        stub.delay = 0.3
+        pool.start()
+
+        try:
+            await _wait_for(lambda: pool.failures >= 1)
+
+            stub.mode = "ok"
+            await _wait_for(lambda: pool.failures == 0 and pool.photos)
+        finally:
+            await pool.stop()
+
+    with PexelsStub() as stub:
+        asyncio.run(run(stub))